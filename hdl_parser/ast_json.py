@@ -7,9 +7,149 @@ Useful for debugging, visualization, and tool integration.
 
 from __future__ import annotations
 import json
-from typing import Any
+import re
+from typing import Any, Callable, get_type_hints
+from fpga_synth.hdl_parser import ast_nodes
 from fpga_synth.hdl_parser.ast_nodes import *
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# orjson only handles 64-bit integers: it rejects wider ones on encode and
+# silently turns them into floats on decode. Wide literals (e.g. 128'h...)
+# are rare, so route those documents through the stdlib instead.
+_WIDE_INT_RE = re.compile(r"\d{20}")
+_WIDE_INT_BYTES_RE = re.compile(rb"\d{20}")
+
+# AST dumps of real designs run to megabytes; use a larger buffer than
+# io.DEFAULT_BUFFER_SIZE for the file helpers.
+_FILE_BUFFER_SIZE = 1 << 20
+
+
+def _dumps(data: Any, indent: int) -> bytes:
+    """
+    Serialize a dict tree to UTF-8 JSON bytes, preferring orjson.
+
+    The stdlib fallback is set up to write what orjson writes, so the
+    output does not depend on which one ran: no spaces after separators
+    when indent is None, and non-ASCII text as UTF-8 rather than \\u escapes.
+    """
+    if orjson is not None and indent in (None, 2):
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+        except TypeError:
+            pass  # Integer wider than 64 bits
+    if indent is None:
+        return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode()
+    return json.dumps(data, indent=indent, ensure_ascii=False).encode()
+
+
+def _loads(text: str | bytes) -> Any:
+    """Parse JSON text or bytes, preferring orjson."""
+    if orjson is not None:
+        wide = _WIDE_INT_RE if isinstance(text, str) else _WIDE_INT_BYTES_RE
+        if not wide.search(text):
+            return orjson.loads(text)
+    return json.loads(text)
+
+
+def _collect_node_classes() -> dict[str, type]:
+    """
+    Map class name → class for the ast_nodes classes and any other ASTNode
+    subclasses.
+
+    The ast_nodes classes are taken from the module itself: slots=True
+    dataclasses replace the class they decorate, and the replaced class
+    stays in __subclasses__() until it is garbage collected. The subclass
+    walk only adds names ast_nodes does not define.
+    """
+    classes = {name: obj for name, obj in vars(ast_nodes).items()
+               if isinstance(obj, type) and issubclass(obj, ASTNode)}
+    stack = [ASTNode]
+    while stack:
+        cls = stack.pop()
+        classes.setdefault(cls.__name__, cls)
+        stack.extend(cls.__subclasses__())
+    return classes
+
+
+_NODE_CLASSES = _collect_node_classes()
+
+
+def _encode_value(value: Any) -> Any:
+    """Generic conversion for fields whose type is not known statically."""
+    if isinstance(value, ASTNode):
+        return ast_to_dict(value)
+    if isinstance(value, list):
+        return [ast_to_dict(item) if isinstance(item, ASTNode) else item for item in value]
+    if isinstance(value, dict):
+        return {k: ast_to_dict(v) if isinstance(v, ASTNode) else v for k, v in value.items()}
+    # Primitive types (str, int, bool, etc.)
+    return value
+
+
+def _keep_as_is(value: Any) -> Any:
+    return value
+
+
+_PRIMITIVE_HINTS = (int, str, bool)
+
+
+def _compile_encoder(cls: type) -> Callable[[ASTNode], dict[str, Any]]:
+    """
+    Generate a straight-line encoder function for one AST node class.
+
+    The generated function reads each dataclass field directly and emits
+    it in declaration order, mirroring the generic rules: None values and
+    the shared empty defaults are skipped, node-typed fields go through
+    the encoder table, and anything else falls back to _encode_value.
+    """
+    child_fields = dict(node_child_fields(cls))
+    hints = get_type_hints(cls)
+    lines = [f"def _encode(n):",
+             f"    d = {{'_type': {cls.__name__!r}}}"]
+    for name in node_field_names(cls):
+        key = repr(name)
+        lines.append(f"    v = n.{name}")
+        if name in child_fields:
+            if child_fields[name]:
+                lines.append(f"    if v is not None and v is not EMPTY_STMTS:")
+                lines.append(f"        d[{key}] = [enc[x.__class__](x) for x in v]")
+            else:
+                lines.append(f"    if v is not None:")
+                lines.append(f"        d[{key}] = enc[v.__class__](v)")
+        elif hints[name] in _PRIMITIVE_HINTS:
+            lines.append(f"    if v is not None:")
+            lines.append(f"        d[{key}] = v")
+        else:
+            lines.append(f"    if v is not None and v is not EMPTY_ATTRIBUTES:")
+            lines.append(f"        d[{key}] = encode_value(v)")
+    lines.append("    return d")
+
+    namespace = {
+        "enc": _ENCODERS,
+        "encode_value": _encode_value,
+        "EMPTY_STMTS": EMPTY_STMTS,
+        "EMPTY_ATTRIBUTES": EMPTY_ATTRIBUTES,
+    }
+    exec("\n".join(lines), namespace)
+    return namespace["_encode"]
+
+
+class _EncoderTable(dict):
+    """Class → encoder; AST classes get a generated encoder on first use."""
+
+    def __missing__(self, cls: type):
+        encoder = _compile_encoder(cls) if issubclass(cls, ASTNode) else _keep_as_is
+        self[cls] = encoder
+        return encoder
+
+
+_ENCODERS = _EncoderTable()
+
 
 def ast_to_dict(node: ASTNode) -> dict[str, Any]:
     """
@@ -20,6 +160,10 @@ def ast_to_dict(node: ASTNode) -> dict[str, Any]:
     - All node attributes (excluding private ones)
     - Nested nodes are recursively converted
 
+    Each node class is encoded by a specialized function generated on
+    first use (see _compile_encoder), so no per-field reflection happens
+    while converting.
+
     Args:
         node: The AST node to convert
 
@@ -28,45 +172,17 @@ def ast_to_dict(node: ASTNode) -> dict[str, Any]:
     """
     if node is None:
         return None
-
-    result = {"_type": node.__class__.__name__}
-
-    # Get all attributes from dataclass fields
-    for field_name in dir(node):
-        # Skip private attributes and methods
-        if field_name.startswith('_'):
-            continue
-
-        value = getattr(node, field_name, None)
-
-        # Skip methods and None values
-        if callable(value) or value is None:
-            continue
-
-        # Convert value based on type
-        if isinstance(value, ASTNode):
-            result[field_name] = ast_to_dict(value)
-        elif isinstance(value, list):
-            result[field_name] = [
-                ast_to_dict(item) if isinstance(item, ASTNode) else item
-                for item in value
-            ]
-        elif isinstance(value, dict):
-            result[field_name] = {
-                k: ast_to_dict(v) if isinstance(v, ASTNode) else v
-                for k, v in value.items()
-            }
-        else:
-            # Primitive types (str, int, bool, etc.)
-            result[field_name] = value
-
-    return result
+    return _ENCODERS[node.__class__](node)
 
 
 def ast_to_json(node: ASTNode, indent: int = 2) -> str:
     """
     Convert an AST node to JSON string.
 
+    With indent=None the JSON is written on one line without spaces
+    (``{"a":1}``). Non-ASCII characters are written as-is, not as \\u
+    escapes.
+
     Args:
         node: The AST node to convert
         indent: Number of spaces for indentation (default: 2)
@@ -75,13 +191,29 @@ def ast_to_json(node: ASTNode, indent: int = 2) -> str:
         JSON string representation of the AST
     """
     data = ast_to_dict(node)
-    return json.dumps(data, indent=indent)
+    return _dumps(data, indent).decode()
+
+
+def _empty_node(data: dict[str, Any]) -> ASTNode:
+    """Instantiate the (still empty) node class named by ``data["_type"]``."""
+    node_type = data.get("_type")
+    if not node_type:
+        raise ValueError("Missing _type field in AST dictionary")
+
+    node_class = _NODE_CLASSES.get(node_type)
+    if node_class is None:
+        raise ValueError(f"Unknown AST node type: {node_type}")
+    return node_class()
 
 
 def dict_to_ast(data: dict[str, Any]) -> ASTNode:
     """
     Convert a dictionary back to an AST node.
 
+    Nodes are built top-down from an explicit work stack rather than by
+    recursion, so arbitrarily deep trees (long operator chains) neither
+    hit the recursion limit nor pay for a Python frame per node.
+
     Args:
         data: Dictionary representation of an AST node
 
@@ -94,42 +226,44 @@ def dict_to_ast(data: dict[str, Any]) -> ASTNode:
     if data is None:
         return None
 
-    node_type = data.get("_type")
-    if not node_type:
-        raise ValueError("Missing _type field in AST dictionary")
-
-    # Get the node class
-    try:
-        node_class = globals()[node_type]
-    except KeyError:
-        raise ValueError(f"Unknown AST node type: {node_type}")
-
-    # Create empty node
-    node = node_class()
-
-    # Set all fields
-    for field_name, value in data.items():
-        if field_name == "_type":
-            continue
-
-        # Convert value based on type
-        if isinstance(value, dict) and "_type" in value:
-            # Nested AST node
-            setattr(node, field_name, dict_to_ast(value))
-        elif isinstance(value, list):
-            # List of items (may contain AST nodes)
-            converted_list = []
-            for item in value:
-                if isinstance(item, dict) and "_type" in item:
-                    converted_list.append(dict_to_ast(item))
-                else:
-                    converted_list.append(item)
-            setattr(node, field_name, converted_list)
-        else:
-            # Primitive type
-            setattr(node, field_name, value)
-
-    return node
+    root = _empty_node(data)
+    stack = [(data, root)]
+    while stack:
+        node_data, node = stack.pop()
+        known_fields = node_field_names(type(node))
+
+        # Set all fields; nested nodes are created empty and queued
+        for field_name, value in node_data.items():
+            if field_name == "_type":
+                continue
+            if field_name not in known_fields:
+                raise ValueError(f"Unknown field '{field_name}' for AST node type "
+                                 f"{node_data['_type']}")
+
+            # Convert value based on type
+            if isinstance(value, dict) and "_type" in value:
+                # Nested AST node
+                child = _empty_node(value)
+                stack.append((value, child))
+                setattr(node, field_name, child)
+            elif isinstance(value, list):
+                # List of items (may contain AST nodes)
+                converted_list = []
+                for item in value:
+                    if isinstance(item, dict) and "_type" in item:
+                        child = _empty_node(item)
+                        stack.append((item, child))
+                        converted_list.append(child)
+                    else:
+                        converted_list.append(item)
+                if not converted_list and getattr(node, field_name) is EMPTY_STMTS:
+                    continue  # Empty optional statement lists stay the shared default
+                setattr(node, field_name, converted_list)
+            else:
+                # Primitive type
+                setattr(node, field_name, value)
+
+    return root
 
 
 def json_to_ast(json_str: str) -> ASTNode:
@@ -142,7 +276,7 @@ def json_to_ast(json_str: str) -> ASTNode:
     Returns:
         Reconstructed AST node
     """
-    data = json.loads(json_str)
+    data = _loads(json_str)
     return dict_to_ast(data)
 
 
@@ -155,8 +289,8 @@ def ast_to_json_file(node: ASTNode, filename: str, indent: int = 2):
         filename: Output file path
         indent: Number of spaces for indentation (default: 2)
     """
-    with open(filename, 'w') as f:
-        f.write(ast_to_json(node, indent=indent))
+    with open(filename, 'wb', buffering=_FILE_BUFFER_SIZE) as f:
+        f.write(_dumps(ast_to_dict(node), indent))
 
 
 def ast_from_json_file(filename: str) -> ASTNode:
@@ -169,8 +303,16 @@ def ast_from_json_file(filename: str) -> ASTNode:
     Returns:
         Reconstructed AST node
     """
-    with open(filename, 'r') as f:
-        return json_to_ast(f.read())
+    with open(filename, 'rb', buffering=_FILE_BUFFER_SIZE) as f:
+        return dict_to_ast(_loads(f.read()))
+
+
+def _approx_len(obj: dict) -> int:
+    """Estimate the one-line JSON length of a flat dict without formatting it."""
+    total = 2
+    for k, v in obj.items():
+        total += len(k) + (len(v) if isinstance(v, str) else 20) + 6
+    return total
 
 
 class CompactJSONEncoder(json.JSONEncoder):
@@ -191,7 +333,7 @@ class CompactJSONEncoder(json.JSONEncoder):
                 for v in obj.values()
             )
 
-            if is_simple and len(str(obj)) < 100:
+            if is_simple and _approx_len(obj) < 100:
                 # Put simple nodes on one line
                 return json.dumps(obj, separators=(',', ':'))
 
@@ -7,33 +7,146 @@ into a netlist DAG.
 """
 
 from __future__ import annotations
-from dataclasses import dataclass, field
-from typing import Optional
+from collections.abc import Sequence
+from dataclasses import dataclass, field, fields
+from operator import attrgetter
+from typing import Optional, Union, get_args, get_origin, get_type_hints
 
 
 # ============================================================
 # Base
 # ============================================================
 
-@dataclass
+class _EmptyAttributes(dict):
+    """Shared, read-only empty attribute dict.
+
+    Almost no nodes carry Verilog attributes, so they all share this one
+    instance instead of allocating an empty dict each. Assign a fresh dict
+    (or use set_attribute()) to attach attributes to a node.
+    """
+    __slots__ = ()
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("shared empty attributes are read-only; use set_attribute()")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    setdefault = update = pop = popitem = clear = _readonly
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (_empty_attributes, ())
+
+
+EMPTY_ATTRIBUTES: dict[str, str] = _EmptyAttributes()
+
+
+def _empty_attributes() -> dict[str, str]:
+    return EMPTY_ATTRIBUTES
+
+
+# Shared value for empty optional statement lists (if-without-else, case
+# without default). Parsed code leaves most of them empty, and every empty
+# one is this tuple, so the fields are typed Sequence: assign a list before
+# mutating.
+EMPTY_STMTS: tuple[Statement, ...] = ()
+
+
+@dataclass(slots=True)
 class ASTNode:
     """Base class for all AST nodes."""
     line: int = 0
     col: int = 0
-    attributes: dict[str, str] = field(default_factory=dict)  # Verilog attributes (* key = value *)
+    attributes: dict[str, str] = field(default_factory=_empty_attributes)  # Verilog attributes (* key = value *)
+
+
+def set_attribute(node: ASTNode, key: str, value: str = ""):
+    """Set a Verilog attribute on a node, allocating its dict on first write."""
+    if node.attributes is EMPTY_ATTRIBUTES:
+        node.attributes = {}
+    node.attributes[key] = value
+
+
+_FIELD_CACHE: dict[type, tuple[str, ...]] = {}
+_GETTER_CACHE: dict[type, attrgetter] = {}
+
+
+def node_field_names(cls: type) -> tuple[str, ...]:
+    """Return the dataclass field names of an AST node class, in declaration order.
+
+    The result is cached per class, so traversals can iterate the real fields
+    instead of filtering ``dir(node)`` on every visit.
+    """
+    names = _FIELD_CACHE.get(cls)
+    if names is None:
+        names = _FIELD_CACHE[cls] = tuple(f.name for f in fields(cls))
+    return names
+
+
+_CHILD_FIELD_CACHE: dict[type, tuple[tuple[str, bool], ...]] = {}
+
+
+def _is_node_type(hint) -> bool:
+    return isinstance(hint, type) and issubclass(hint, ASTNode)
+
+
+def node_child_fields(cls: type) -> tuple[tuple[str, bool], ...]:
+    """Return the fields of an AST node class that can hold child nodes.
+
+    Each entry is ``(field_name, is_list)``: ``is_list`` is True for
+    ``list[<node type>]`` and ``Sequence[<node type>]`` fields and False for
+    single (possibly None) node fields. Primitive fields are left out, so
+    traversals only touch fields that can actually contain nodes. Classified once per class from the
+    dataclass type hints.
+    """
+    plan = _CHILD_FIELD_CACHE.get(cls)
+    if plan is None:
+        hints = get_type_hints(cls)
+        entries = []
+        for name in node_field_names(cls):
+            hint = hints[name]
+            origin = get_origin(hint)
+            if origin is list or origin is Sequence:
+                if _is_node_type(get_args(hint)[0]):
+                    entries.append((name, True))
+                continue
+            if get_origin(hint) is Union:
+                args = [a for a in get_args(hint) if a is not type(None)]
+                hint = args[0] if len(args) == 1 else None
+            if _is_node_type(hint):
+                entries.append((name, False))
+        plan = _CHILD_FIELD_CACHE[cls] = tuple(entries)
+    return plan
+
+
+def node_field_items(node: ASTNode) -> zip:
+    """Return (field_name, value) pairs for a node, in declaration order.
+
+    All values are read through one cached ``attrgetter`` per class, a single
+    C call that returns a tuple of the node's slot values.
+    """
+    cls = type(node)
+    getter = _GETTER_CACHE.get(cls)
+    if getter is None:
+        getter = _GETTER_CACHE[cls] = attrgetter(*node_field_names(cls))
+    return zip(_FIELD_CACHE[cls], getter(node))
 
 
 # ============================================================
 # Expressions
 # ============================================================
 
-@dataclass
+@dataclass(slots=True)
 class Expr(ASTNode):
     """Base class for expressions."""
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class NumberLiteral(Expr):
     """Numeric literal: 42, 8'hFF, 4'b1010, etc."""
     raw: str = ""          # Original text
@@ -42,19 +155,23 @@ class NumberLiteral(Expr):
     is_signed: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class StringLiteral(Expr):
     """String literal: "hello world" """
     value: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class Identifier(Expr):
-    """A signal or parameter reference: my_signal"""
+    """A signal or parameter reference: my_signal
+
+    The lexer interns ``name`` (sys.intern); other AST producers should do
+    the same so the elaborator's name lookups stay on the identity fast path.
+    """
     name: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class BitSelect(Expr):
     """Bit or part select: signal[7:0] or signal[3] or signal[base +: width]"""
     target: Expr = None
@@ -63,14 +180,14 @@ class BitSelect(Expr):
     select_type: str = "normal"  # "normal" ([:]), "plus" ([+:]), or "minus" ([-:])
 
 
-@dataclass
+@dataclass(slots=True)
 class UnaryOp(Expr):
     """Unary operation: ~a, !a, &a, |a, ^a, -a"""
     op: str = ""           # "~", "!", "&", "|", "^", "-", "+"
     operand: Expr = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BinaryOp(Expr):
     """Binary operation: a + b, a & b, a == b, etc."""
     op: str = ""           # "+", "-", "*", "/", "%", "&", "|", "^",
@@ -80,7 +197,7 @@ class BinaryOp(Expr):
     right: Expr = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TernaryOp(Expr):
     """Ternary/conditional: cond ? true_val : false_val"""
     cond: Expr = None
@@ -88,20 +205,20 @@ class TernaryOp(Expr):
     false_val: Expr = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Concat(Expr):
     """Concatenation: {a, b, c}"""
     parts: list[Expr] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Repeat(Expr):
     """Replication: {4{a}}"""
     count: Expr = None
     value: Expr = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FuncCall(Expr):
     """System/user function call: $clog2(N)"""
     name: str = ""
@@ -112,51 +229,59 @@ class FuncCall(Expr):
 # Statements
 # ============================================================
 
-@dataclass
+@dataclass(slots=True)
 class Statement(ASTNode):
     """Base class for statements."""
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class BlockingAssign(Statement):
     """Blocking assignment: lhs = rhs;"""
     lhs: Expr = None
     rhs: Expr = None
 
 
-@dataclass
+@dataclass(slots=True)
 class NonBlockingAssign(Statement):
     """Non-blocking assignment: lhs <= rhs;"""
     lhs: Expr = None
     rhs: Expr = None
 
 
-@dataclass
+@dataclass(slots=True)
 class IfStatement(Statement):
     """if/else: if (cond) ... else ..."""
     cond: Expr = None
     then_body: list[Statement] = field(default_factory=list)
-    else_body: list[Statement] = field(default_factory=list)
+    else_body: Sequence[Statement] = EMPTY_STMTS
 
+    def __post_init__(self):
+        if not self.else_body:
+            self.else_body = EMPTY_STMTS
 
-@dataclass
+
+@dataclass(slots=True)
 class CaseStatement(Statement):
     """case/casex/casez"""
     kind: str = "case"     # "case", "casex", "casez"
     expr: Expr = None
     items: list[CaseItem] = field(default_factory=list)
-    default: list[Statement] = field(default_factory=list)
+    default: Sequence[Statement] = EMPTY_STMTS
+
+    def __post_init__(self):
+        if not self.default:
+            self.default = EMPTY_STMTS
 
 
-@dataclass
+@dataclass(slots=True)
 class CaseItem(ASTNode):
     """A single arm of a case statement."""
     values: list[Expr] = field(default_factory=list)
     body: list[Statement] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ForStatement(Statement):
     """for loop (used in generate blocks)."""
     init: Statement = None
@@ -165,33 +290,33 @@ class ForStatement(Statement):
     body: list[Statement] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class WhileStatement(Statement):
     """while loop: while (condition) ..."""
     cond: Expr = None
     body: list[Statement] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class RepeatStatement(Statement):
     """repeat loop: repeat (N) ..."""
     count: Expr = None
     body: list[Statement] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ForeverStatement(Statement):
     """forever loop: forever ..."""
     body: list[Statement] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class DisableStatement(Statement):
     """disable statement: disable block_name;"""
     target: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class Block(Statement):
     """begin...end block, optionally named."""
     name: str = ""
@@ -202,14 +327,14 @@ class Block(Statement):
 # Declarations
 # ============================================================
 
-@dataclass
+@dataclass(slots=True)
 class Range(ASTNode):
     """Bit range: [msb:lsb]"""
     msb: Expr = None
     lsb: Expr = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PortDecl(ASTNode):
     """Port declaration: input [7:0] data, input [7:0] mem [0:255]"""
     direction: str = "input"   # "input", "output", "inout"
@@ -220,7 +345,7 @@ class PortDecl(ASTNode):
     array_dims: list[Range] = field(default_factory=list)  # Unpacked dimensions
 
 
-@dataclass
+@dataclass(slots=True)
 class NetDecl(ASTNode):
     """Wire/reg declaration: wire [3:0] foo; / reg [7:0] mem [0:255];"""
     net_type: str = "wire"
@@ -231,7 +356,7 @@ class NetDecl(ASTNode):
     init_value: Optional[Expr] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ParamDecl(ASTNode):
     """Parameter/localparam declaration."""
     kind: str = "parameter"    # "parameter" or "localparam"
@@ -241,13 +366,13 @@ class ParamDecl(ASTNode):
     value: Expr = None
 
 
-@dataclass
+@dataclass(slots=True)
 class IntegerDecl(ASTNode):
     """integer i;  (used for loop variables)."""
     name: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class RealDecl(ASTNode):
     """real / realtime declaration: real x; realtime t;"""
     kind: str = "real"  # "real" or "realtime"
@@ -255,26 +380,26 @@ class RealDecl(ASTNode):
     init_value: Optional[Expr] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TimeDecl(ASTNode):
     """time declaration: time t;"""
     name: str = ""
     init_value: Optional[Expr] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EventDecl(ASTNode):
     """event declaration: event e;"""
     name: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class EventTrigger(Statement):
     """Event trigger: -> event_name;"""
     event: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class SpecifyBlock(ASTNode):
     """Specify block: specify ... endspecify (timing specifications)"""
     # For now, just store as unparsed - timing is typically ignored in synthesis
@@ -285,21 +410,21 @@ class SpecifyBlock(ASTNode):
 # Module-level constructs
 # ============================================================
 
-@dataclass
+@dataclass(slots=True)
 class ContinuousAssign(ASTNode):
     """assign lhs = rhs;"""
     lhs: Expr = None
     rhs: Expr = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SensItem(ASTNode):
     """Sensitivity list item: posedge clk, negedge rst, or plain signal."""
     edge: str = ""         # "posedge", "negedge", or "" for level
     signal: Expr = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AlwaysBlock(ASTNode):
     """always @(...) begin ... end"""
     sensitivity: list[SensItem] = field(default_factory=list)
@@ -307,20 +432,20 @@ class AlwaysBlock(ASTNode):
     body: list[Statement] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class InitialBlock(ASTNode):
     """initial begin ... end"""
     body: list[Statement] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class PortConnection(ASTNode):
     """A port connection in a module instantiation: .port_name(expr)"""
     port_name: str = ""
     expr: Optional[Expr] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ModuleInstance(ASTNode):
     """Module instantiation: mod_name #(.P(V)) inst_name (.port(sig));"""
     module_name: str = ""
@@ -329,13 +454,13 @@ class ModuleInstance(ASTNode):
     ports: list[PortConnection] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class GenerateBlock(ASTNode):
     """generate ... endgenerate block."""
     items: list[ASTNode] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskDecl(ASTNode):
     """Task declaration: task name; ... endtask"""
     name: str = ""
@@ -346,7 +471,7 @@ class TaskDecl(ASTNode):
     body: list[Statement] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class FunctionDecl(ASTNode):
     """Function declaration: function [range] name; ... endfunction"""
     name: str = ""
@@ -357,14 +482,14 @@ class FunctionDecl(ASTNode):
     body: list[Statement] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskCall(Statement):
     """Task call statement: task_name(arg1, arg2);"""
     name: str = ""
     args: list[Expr] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class SystemTaskCall(Statement):
     """System task call: $display(...), $finish, etc."""
     name: str = ""  # e.g., "$display"
@@ -375,7 +500,7 @@ class SystemTaskCall(Statement):
 # Top-level
 # ============================================================
 
-@dataclass
+@dataclass(slots=True)
 class Module(ASTNode):
     """A Verilog module definition."""
     name: str = ""
@@ -385,7 +510,7 @@ class Module(ASTNode):
     # Populated during parsing: all declarations, assigns, always blocks, instances
 
 
-@dataclass
+@dataclass(slots=True)
 class SourceFile(ASTNode):
     """A complete Verilog source file (one or more modules)."""
     modules: list[Module] = field(default_factory=list)
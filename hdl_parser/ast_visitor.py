@@ -6,10 +6,50 @@ and perform various operations like analysis, transformation, or code generation
 """
 
 from __future__ import annotations
-from typing import Any, Optional
+from collections import Counter
+from typing import Any, Callable, Optional
 from fpga_synth.hdl_parser.ast_nodes import *
 
 
+def walk(node: Optional[ASTNode]):
+    """
+    Yield every node in the subtree rooted at ``node``, in pre-order.
+
+    Produces the same order as a recursive ASTVisitor traversal, but uses an
+    explicit stack: no per-node method dispatch and no recursion limit.
+    Collector visitors that only need to see every node use this fast path.
+    """
+    stack = [node] if node is not None else []
+    pop = stack.pop
+    while stack:
+        n = pop()
+        yield n
+
+        children = []
+        for field_name, is_list in node_child_fields(type(n)):
+            value = getattr(n, field_name)
+            if is_list:
+                children.extend(value)
+            elif value is not None:
+                children.append(value)
+        children.reverse()
+        stack.extend(children)
+
+
+def _overrides_dispatch(cls: type, base: type) -> bool:
+    """
+    Whether ``cls`` (a subclass of ``base``) defines generic_visit or any
+    visit_* method of its own. Collectors take their walk() fast path only
+    when it does not, so overridden methods still get called.
+    """
+    for klass in cls.__mro__:
+        if klass is base:
+            return False
+        if any(name == "generic_visit" or name.startswith("visit_") for name in vars(klass)):
+            return True
+    return False
+
+
 class ASTVisitor:
     """
     Base class for AST visitors using the visitor pattern.
@@ -28,6 +68,14 @@ class ASTVisitor:
         visitor.visit(ast)
     """
 
+    # Per-visitor-class cache: node class → visit_* function (or generic_visit).
+    # Each subclass gets its own dict via __init_subclass__.
+    _visit_cache: dict[type, Callable] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._visit_cache = {}
+
     def visit(self, node: ASTNode) -> Any:
         """
         Visit a node by dispatching to the appropriate visit_* method.
@@ -35,30 +83,31 @@ class ASTVisitor:
         if node is None:
             return None
 
-        method_name = f'visit_{node.__class__.__name__}'
-        visitor_method = getattr(self, method_name, self.generic_visit)
-        return visitor_method(node)
+        node_class = node.__class__
+        visitor_method = self._visit_cache.get(node_class)
+        if visitor_method is None:
+            visitor_class = type(self)
+            visitor_method = getattr(visitor_class, f'visit_{node_class.__name__}',
+                                     visitor_class.generic_visit)
+            self._visit_cache[node_class] = visitor_method
+        return visitor_method(self, node)
 
     def generic_visit(self, node: ASTNode) -> Any:
         """
         Default visitor that recursively visits all children.
         Override this to provide default behavior for all nodes.
         """
-        # Visit all child nodes
-        for field_name in dir(node):
-            if field_name.startswith('_'):
-                continue
-
-            value = getattr(node, field_name, None)
+        # Visit all child nodes (only fields typed to hold nodes)
+        for field_name, is_list in node_child_fields(type(node)):
+            value = getattr(node, field_name)
 
             # Visit list of nodes
-            if isinstance(value, list):
+            if is_list:
                 for item in value:
-                    if isinstance(item, ASTNode):
-                        self.visit(item)
+                    self.visit(item)
 
             # Visit single node
-            elif isinstance(value, ASTNode):
+            elif value is not None:
                 self.visit(value)
 
         return None
@@ -88,33 +137,38 @@ class ASTTransformer(ASTVisitor):
         """
         Default transformer that recursively transforms all children.
         """
-        # Transform all child nodes
-        for field_name in dir(node):
-            if field_name.startswith('_'):
-                continue
-
-            value = getattr(node, field_name, None)
-
-            # Transform list of nodes
-            if isinstance(value, list):
+        # Transform all child nodes (only fields typed to hold nodes)
+        for field_name, is_list in node_child_fields(type(node)):
+            value = getattr(node, field_name)
+
+            # Transform list of nodes. The original list (and its identity)
+            # is kept unless some item was replaced or removed.
+            if is_list:
+                if not value:
+                    continue  # Keep shared empty defaults as they are
                 new_list = []
+                changed = False
                 for item in value:
-                    if isinstance(item, ASTNode):
-                        new_item = self.visit(item)
-                        if new_item is not None:
-                            new_list.append(new_item)
-                    else:
-                        new_list.append(item)
-                setattr(node, field_name, new_list)
+                    new_item = self.visit(item)
+                    if new_item is not item:
+                        changed = True
+                    if new_item is not None:
+                        new_list.append(new_item)
+                if changed:
+                    setattr(node, field_name, new_list)
 
             # Transform single node
-            elif isinstance(value, ASTNode):
+            elif value is not None:
                 new_value = self.visit(value)
-                setattr(node, field_name, new_value)
+                if new_value is not value:
+                    setattr(node, field_name, new_value)
 
         return node
 
 
+_MISSING = object()
+
+
 class ASTDumper(ASTVisitor):
     """
     Visitor that dumps the AST structure as formatted text.
@@ -140,12 +194,15 @@ class ASTDumper(ASTVisitor):
 
         # Get important attributes to display
         attrs = []
-        if hasattr(node, 'name') and isinstance(node.name, str):
-            attrs.append(f"name='{node.name}'")
-        if hasattr(node, 'op') and isinstance(node.op, str):
-            attrs.append(f"op='{node.op}'")
-        if hasattr(node, 'value') and not isinstance(node.value, ASTNode):
-            value_str = str(node.value)
+        name = getattr(node, 'name', None)
+        if isinstance(name, str):
+            attrs.append(f"name='{name}'")
+        op = getattr(node, 'op', None)
+        if isinstance(op, str):
+            attrs.append(f"op='{op}'")
+        value = getattr(node, 'value', _MISSING)
+        if value is not _MISSING and not isinstance(value, ASTNode):
+            value_str = str(value)
             if len(value_str) > 30:
                 value_str = value_str[:27] + "..."
             attrs.append(f"value={value_str}")
@@ -164,11 +221,28 @@ class ASTDumper(ASTVisitor):
 class ModuleCollector(ASTVisitor):
     """
     Visitor that collects all modules in the AST.
+
+    Uses the iterative walk() fast path instead of per-node dispatch, unless
+    a subclass overrides generic_visit or a visit_* method.
     """
 
+    _fast_walk = True
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._fast_walk = not _overrides_dispatch(cls, ModuleCollector)
+
     def __init__(self):
         self.modules = []
 
+    def visit(self, node: ASTNode) -> Any:
+        if not self._fast_walk:
+            return super().visit(node)
+        for n in walk(node):
+            if isinstance(n, Module):
+                self.modules.append(n)
+        return None
+
     def visit_Module(self, node: Module) -> Any:
         self.modules.append(node)
         return self.generic_visit(node)
@@ -177,11 +251,29 @@ class ModuleCollector(ASTVisitor):
 class IdentifierCollector(ASTVisitor):
     """
     Visitor that collects all identifier names used in the AST.
+
+    Uses the iterative walk() fast path instead of per-node dispatch, unless
+    a subclass overrides generic_visit or a visit_* method.
     """
 
+    _fast_walk = True
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._fast_walk = not _overrides_dispatch(cls, IdentifierCollector)
+
     def __init__(self):
         self.identifiers = set()
 
+    def visit(self, node: ASTNode) -> Any:
+        if not self._fast_walk:
+            return super().visit(node)
+        add = self.identifiers.add
+        for n in walk(node):
+            if isinstance(n, Identifier):
+                add(n.name)
+        return None
+
     def visit_Identifier(self, node: Identifier) -> Any:
         self.identifiers.add(node.name)
         return None
@@ -190,12 +282,31 @@ class IdentifierCollector(ASTVisitor):
 class StatisticsVisitor(ASTVisitor):
     """
     Visitor that collects statistics about the AST.
+
+    Uses the iterative walk() fast path instead of per-node dispatch, unless
+    a subclass overrides generic_visit or a visit_* method.
     """
 
+    _fast_walk = True
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._fast_walk = not _overrides_dispatch(cls, StatisticsVisitor)
+
     def __init__(self):
         self.node_counts = {}
         self.total_nodes = 0
 
+    def visit(self, node: ASTNode) -> Any:
+        if not self._fast_walk:
+            return super().visit(node)
+        # Counter's tallying loop runs in C
+        counts = Counter(n.__class__.__name__ for n in walk(node))
+        for node_type, count in counts.items():
+            self.node_counts[node_type] = self.node_counts.get(node_type, 0) + count
+        self.total_nodes += sum(counts.values())
+        return None
+
     def generic_visit(self, node: ASTNode) -> Any:
         node_type = node.__class__.__name__
         self.node_counts[node_type] = self.node_counts.get(node_type, 0) + 1
@@ -6,10 +6,44 @@ Useful for pretty-printing, code transformation, and template generation.
 """
 
 from __future__ import annotations
-from typing import Optional
+import threading
+from typing import Callable, Optional
 from fpga_synth.hdl_parser.ast_nodes import *
 
 
+# Binary operators with their surrounding spaces, so _gen_BinaryOp does not
+# format a new string per node. Operators missing here are formatted.
+_OP_TEXT = {op: f" {op} " for op in (
+    "+", "-", "*", "/", "%", "**",
+    "&", "|", "^", "~^", "^~", "&&", "||",
+    "==", "!=", "===", "!==", "<", ">", "<=", ">=",
+    "<<", ">>", "<<<", ">>>",
+)}
+
+
+def _port_head(port: PortDecl) -> str:
+    """Direction, non-default net type and signedness of a port declaration."""
+    head = port.direction
+    if port.net_type != "wire":
+        head = f"{head} {port.net_type}"
+    if port.signed:
+        head += " signed"
+    return head
+
+
+class _IndentTable(dict):
+    """Indent level → indentation string, built once per level on first use."""
+
+    def __init__(self, unit: str):
+        super().__init__()
+        self.unit = unit
+
+    def __missing__(self, level: int) -> str:
+        text = self.unit * level
+        self[level] = text
+        return text
+
+
 class VerilogCodeGenerator:
     """
     Generates Verilog source code from AST nodes.
@@ -17,21 +51,39 @@ class VerilogCodeGenerator:
     Configurable indentation and formatting options.
     """
 
-    def __init__(self, indent_str: str = "    "):
+    # Per-generator-class cache: node class → _gen_* function.
+    # Each subclass gets its own dict via __init_subclass__.
+    _dispatch: dict[type, Callable] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._dispatch = {}
+
+    def __init__(self, indent_str: str = "    ", module_cache: Optional[dict] = None):
         self.indent_str = indent_str
         self.indent_level = 0
         self.output = []
+        self._indents = _IndentTable(indent_str)
+        # Optional (id(module), indent_str) → (module, text) memo, shared by
+        # the caller across generate() runs; see generate_verilog().
+        self.module_cache = module_cache
 
     def generate(self, node: ASTNode) -> str:
         """Generate Verilog code from an AST node."""
-        self.output = []
-        self.indent_level = 0
+        self.reset()
         self._visit(node)
         return "".join(self.output)
 
-    def _indent(self):
-        """Add current indentation to output."""
-        self.output.append(self.indent_str * self.indent_level)
+    def reset(self):
+        """Drop any previous output so the generator can be reused."""
+        self.output = []
+        self.indent_level = 0
+        if self._indents.unit != self.indent_str:
+            self._indents = _IndentTable(self.indent_str)
+
+    def _indent(self, text: str = ""):
+        """Add current indentation (followed by ``text``) to output."""
+        self.output.append(self._indents[self.indent_level] + text)
 
     def _write(self, text: str):
         """Write text to output."""
@@ -39,21 +91,84 @@ class VerilogCodeGenerator:
 
     def _writeln(self, text: str = ""):
         """Write text with newline."""
-        if text:
-            self.output.append(text)
-        self.output.append("\n")
+        self.output.append(text + "\n")
+
+    def _line(self, text: str):
+        """Write an indented line: indentation, text and newline in one append."""
+        self.output.append(self._indents[self.indent_level] + text + "\n")
 
     def _visit(self, node: ASTNode):
         """Dispatch to appropriate generation method."""
-        if node is None:
+        node_class = node.__class__
+        method = self._dispatch.get(node_class)
+        if method is None:
+            # Absent optional children are rare, so they are handled here on
+            # the cache-miss path rather than tested for on every visit.
+            if node is None:
+                return
+            method = getattr(type(self), f'_gen_{node_class.__name__}', None)
+            if method is None:
+                raise NotImplementedError(f"Code generation for {node_class.__name__} not implemented")
+            self._dispatch[node_class] = method
+
+        # Identifiers and literals are most of the nodes in any design; unless
+        # a subclass overrides their generators, write them without a call.
+        if method is _gen_identifier:
+            self.output.append(node.name)
+        elif method is _gen_number_literal:
+            self.output.append(node.raw)
+        else:
+            method(self, node)
+
+    def _write_body(self, stmts: list[ASTNode], closing: str):
+        """
+        Write each statement on its own line one indent level deeper, then
+        ``closing`` (e.g. "end\\n") indented at the current level.
+        """
+        level = self.indent_level
+        indents = self._indents
+        write = self.output.append
+        if stmts:
+            self.indent_level = level + 1
+            indent = indents[level + 1]
+            visit = self._visit
+            for stmt in stmts:
+                write(indent)
+                visit(stmt)
+            self.indent_level = level
+        write(indents[level] + closing)
+
+    def _write_list(self, nodes: list[ASTNode]):
+        """
+        Write nodes separated by ", ".
+
+        Lists made only of identifiers and literals (bus concatenations,
+        $display arguments, case labels) are joined into one string; any
+        other node, or a leaf generator overridden by a subclass, falls
+        back to visiting item by item.
+        """
+        dispatch = self._dispatch
+        texts = []
+        for item in nodes:
+            method = dispatch.get(item.__class__)
+            if method is _gen_identifier:
+                texts.append(item.name)
+            elif method is _gen_number_literal:
+                texts.append(item.raw)
+            elif method is _gen_string_literal:
+                texts.append(f'"{item.value}"')
+            else:
+                break
+        else:
+            self.output.append(", ".join(texts))
             return
 
-        method_name = f'_gen_{node.__class__.__name__}'
-        method = getattr(self, method_name, None)
-        if method:
-            method(node)
-        else:
-            raise NotImplementedError(f"Code generation for {node.__class__.__name__} not implemented")
+        write = self.output.append
+        visit = self._visit
+        for i, item in enumerate(nodes):
+            if i > 0:
+                write(", ")
+            visit(item)
 
     # ============================================================
     # Top-level
@@ -63,55 +178,81 @@ class VerilogCodeGenerator:
         """Generate source file with multiple modules."""
         for i, module in enumerate(node.modules):
             if i > 0:
-                self._writeln()
+                self._write("\n")
             self._visit(module)
 
     def _gen_Module(self, node: Module):
+        """Generate module definition, reusing cached text when available."""
+        cache = self.module_cache
+        if cache is None:
+            self._gen_module_text(node)
+            return
+
+        key = (id(node), self.indent_str)
+        entry = cache.get(key)
+        if entry is not None and entry[0] is node:
+            self.output.append(entry[1])
+            return
+        start = len(self.output)
+        self._gen_module_text(node)
+        # Keeping the node in the entry also keeps its id() from being reused
+        cache[key] = (node, "".join(self.output[start:]))
+
+    def _gen_module_text(self, node: Module):
         """Generate module definition."""
-        self._write(f"module {node.name}")
+        write = self.output.append
+        visit = self._visit
+        indents = self._indents
+        level = self.indent_level
+        write(f"module {node.name}")
 
         # Parameters
-        if node.params:
-            self._writeln(" #(")
-            self.indent_level += 1
-            for i, param in enumerate(node.params):
-                self._indent()
-                self._write(f"parameter {param.name}")
+        params = node.params
+        if params:
+            write(" #(\n")
+            self.indent_level = level + 1
+            indent = indents[level + 1]
+            last = len(params) - 1
+            for i, param in enumerate(params):
+                write(f"{indent}parameter {param.name}")
                 if param.value:
-                    self._write(" = ")
-                    self._visit(param.value)
-                if i < len(node.params) - 1:
-                    self._write(",")
-                self._writeln()
-            self.indent_level -= 1
-            self._write(")")
+                    write(" = ")
+                    visit(param.value)
+                write(",\n" if i < last else "\n")
+            self.indent_level = level
+            write(")")
 
         # Ports
-        if node.ports:
-            self._writeln(" (")
-            self.indent_level += 1
-            for i, port in enumerate(node.ports):
-                self._indent()
-                self._gen_PortDecl(port)
-                if i < len(node.ports) - 1:
-                    self._write(",")
-                self._writeln()
-            self.indent_level -= 1
-            self._write(")")
+        ports = node.ports
+        if ports:
+            write(" (\n")
+            self.indent_level = level + 1
+            indent = indents[level + 1]
+            last = len(ports) - 1
+            if (type(self)._gen_PortDecl is _gen_port_decl
+                    and all(p.range is None and not p.array_dims for p in ports)):
+                # Scalar ports only: the whole list is plain text
+                write(",\n".join([f"{indent}{_port_head(p)} {p.name}" for p in ports]) + "\n")
+            else:
+                for i, port in enumerate(ports):
+                    write(indent)
+                    self._gen_PortDecl(port)
+                    write(",\n" if i < last else "\n")
+            self.indent_level = level
+            write(")")
 
-        self._writeln(";")
+        write(";\n")
 
-        # Module body
+        # Module body: a blank line, then the indented item
         if node.body:
-            self.indent_level += 1
+            self.indent_level = level + 1
+            separator = "\n" + indents[level + 1]
             for item in node.body:
-                self._writeln()
-                self._indent()
-                self._visit(item)
-            self.indent_level -= 1
+                write(separator)
+                visit(item)
+            self.indent_level = level
 
-        self._writeln()
-        self._writeln("endmodule")
+        write("\nendmodule\n")
 
     # ============================================================
     # Declarations
@@ -119,15 +260,13 @@ class VerilogCodeGenerator:
 
     def _gen_PortDecl(self, node: PortDecl):
         """Generate port declaration."""
-        self._write(node.direction)
-        if node.net_type != "wire":
-            self._write(f" {node.net_type}")
-        if node.signed:
-            self._write(" signed")
+        head = _port_head(node)
         if node.range:
-            self._write(" ")
+            self._write(head + " ")
             self._visit(node.range)
-        self._write(f" {node.name}")
+            self._write(f" {node.name}")
+        else:
+            self._write(f"{head} {node.name}")
 
         # Array dimensions
         for dim in node.array_dims:
@@ -136,13 +275,13 @@ class VerilogCodeGenerator:
 
     def _gen_NetDecl(self, node: NetDecl):
         """Generate wire/reg declaration."""
-        self._write(node.net_type)
-        if node.signed:
-            self._write(" signed")
+        head = f"{node.net_type} signed" if node.signed else node.net_type
         if node.range:
-            self._write(" ")
+            self._write(head + " ")
             self._visit(node.range)
-        self._write(f" {node.name}")
+            self._write(f" {node.name}")
+        else:
+            self._write(f"{head} {node.name}")
 
         # Array dimensions
         for dim in node.array_dims:
@@ -153,46 +292,47 @@ class VerilogCodeGenerator:
             self._write(" = ")
             self._visit(node.init_value)
 
-        self._writeln(";")
+        self._write(";\n")
 
     def _gen_ParamDecl(self, node: ParamDecl):
         """Generate parameter/localparam declaration."""
-        self._write(node.kind)
-        if node.signed:
-            self._write(" signed")
+        head = f"{node.kind} signed" if node.signed else node.kind
         if node.range:
-            self._write(" ")
+            self._write(head + " ")
             self._visit(node.range)
-        self._write(f" {node.name}")
+            self._write(f" {node.name}")
+        else:
+            self._write(f"{head} {node.name}")
         if node.value:
             self._write(" = ")
             self._visit(node.value)
-        self._writeln(";")
+        self._write(";\n")
 
     def _gen_IntegerDecl(self, node: IntegerDecl):
         """Generate integer declaration."""
-        self._writeln(f"integer {node.name};")
+        self._write(f"integer {node.name};\n")
 
     def _gen_RealDecl(self, node: RealDecl):
         """Generate real/realtime declaration."""
-        self._write(node.kind)
-        self._write(f" {node.name}")
         if node.init_value:
-            self._write(" = ")
+            self._write(f"{node.kind} {node.name} = ")
             self._visit(node.init_value)
-        self._writeln(";")
+            self._write(";\n")
+        else:
+            self._write(f"{node.kind} {node.name};\n")
 
     def _gen_TimeDecl(self, node: TimeDecl):
         """Generate time declaration."""
-        self._write(f"time {node.name}")
         if node.init_value:
-            self._write(" = ")
+            self._write(f"time {node.name} = ")
             self._visit(node.init_value)
-        self._writeln(";")
+            self._write(";\n")
+        else:
+            self._write(f"time {node.name};\n")
 
     def _gen_EventDecl(self, node: EventDecl):
         """Generate event declaration."""
-        self._writeln(f"event {node.name};")
+        self._write(f"event {node.name};\n")
 
     def _gen_Range(self, node: Range):
         """Generate bit range [msb:lsb]."""
@@ -212,41 +352,29 @@ class VerilogCodeGenerator:
         self._visit(node.lhs)
         self._write(" = ")
         self._visit(node.rhs)
-        self._writeln(";")
+        self._write(";\n")
 
     def _gen_AlwaysBlock(self, node: AlwaysBlock):
         """Generate always block."""
-        self._write("always @(")
+        write = self.output.append
+        visit = self._visit
+        write("always @(")
         if node.is_star:
-            self._write("*")
+            write("*")
         else:
             for i, sens in enumerate(node.sensitivity):
                 if i > 0:
-                    self._write(" or ")
-                self._visit(sens)
-        self._writeln(") begin")
-
-        self.indent_level += 1
-        for stmt in node.body:
-            self._indent()
-            self._visit(stmt)
-        self.indent_level -= 1
+                    write(" or ")
+                visit(sens)
+        write(") begin\n")
 
-        self._indent()
-        self._writeln("end")
+        self._write_body(node.body, "end\n")
 
     def _gen_InitialBlock(self, node: InitialBlock):
         """Generate initial block."""
-        self._writeln("initial begin")
+        self._write("initial begin\n")
 
-        self.indent_level += 1
-        for stmt in node.body:
-            self._indent()
-            self._visit(stmt)
-        self.indent_level -= 1
-
-        self._indent()
-        self._writeln("end")
+        self._write_body(node.body, "end\n")
 
     def _gen_SensItem(self, node: SensItem):
         """Generate sensitivity list item."""
@@ -256,50 +384,46 @@ class VerilogCodeGenerator:
 
     def _gen_ModuleInstance(self, node: ModuleInstance):
         """Generate module instantiation."""
-        self._write(f"{node.module_name} ")
+        write = self.output.append
+        visit = self._visit
 
         # Parameter overrides
         if node.params:
-            self._write("#(")
-            for i, param in enumerate(node.params):
-                if i > 0:
-                    self._write(", ")
-                self._visit(param)
-            self._write(") ")
-
-        self._write(f"{node.instance_name} (")
+            write(f"{node.module_name} #(")
+            self._write_list(node.params)
+            write(f") {node.instance_name} (")
+        else:
+            write(f"{node.module_name} {node.instance_name} (")
 
         # Port connections
         for i, port in enumerate(node.ports):
             if i > 0:
-                self._write(", ")
-            self._visit(port)
+                write(", ")
+            visit(port)
 
-        self._writeln(");")
+        write(");\n")
 
     def _gen_PortConnection(self, node: PortConnection):
         """Generate port connection."""
+        expr = node.expr
+        if self._dispatch.get(expr.__class__) is _gen_identifier:
+            # Most ports connect a plain signal: one string for the whole item
+            self.output.append(f".{node.port_name}({expr.name})")
+            return
         self._write(f".{node.port_name}(")
-        if node.expr:
-            self._visit(node.expr)
+        if expr:
+            self._visit(expr)
         self._write(")")
 
     def _gen_GenerateBlock(self, node: GenerateBlock):
         """Generate generate block."""
-        self._writeln("generate")
-        self.indent_level += 1
-        for item in node.items:
-            self._indent()
-            self._visit(item)
-        self.indent_level -= 1
-        self._indent()
-        self._writeln("endgenerate")
+        self._write("generate\n")
+        self._write_body(node.items, "endgenerate\n")
 
     def _gen_SpecifyBlock(self, node: SpecifyBlock):
         """Generate specify block (empty placeholder)."""
-        self._writeln("specify")
-        self._indent()
-        self._writeln("endspecify")
+        self._write("specify\n")
+        self._line("endspecify")
 
     # ============================================================
     # Statements
@@ -310,136 +434,105 @@ class VerilogCodeGenerator:
         self._visit(node.lhs)
         self._write(" = ")
         self._visit(node.rhs)
-        self._writeln(";")
+        self._write(";\n")
 
     def _gen_NonBlockingAssign(self, node: NonBlockingAssign):
         """Generate non-blocking assignment."""
         self._visit(node.lhs)
         self._write(" <= ")
         self._visit(node.rhs)
-        self._writeln(";")
+        self._write(";\n")
 
     def _gen_IfStatement(self, node: IfStatement):
         """Generate if statement."""
-        self._write("if (")
-        self._visit(node.cond)
-        self._writeln(") begin")
-
-        self.indent_level += 1
-        for stmt in node.then_body:
-            self._indent()
-            self._visit(stmt)
-        self.indent_level -= 1
-
-        self._indent()
-        if node.else_body:
-            self._writeln("end else begin")
-            self.indent_level += 1
-            for stmt in node.else_body:
-                self._indent()
-                self._visit(stmt)
-            self.indent_level -= 1
-            self._indent()
-        self._writeln("end")
+        write = self.output.append
+        visit = self._visit
+        write("if (")
+        visit(node.cond)
+        write(") begin\n")
+
+        else_body = node.else_body
+        if not else_body:
+            self._write_body(node.then_body, "end\n")
+        elif len(else_body) == 1:
+            # A single statement needs no begin/end; this also turns nested
+            # ifs into flat "end else if (...) begin" chains.
+            self._write_body(node.then_body, "end else ")
+            self._visit(else_body[0])
+        else:
+            self._write_body(node.then_body, "end else begin\n")
+            self._write_body(else_body, "end\n")
 
     def _gen_CaseStatement(self, node: CaseStatement):
         """Generate case statement."""
-        self._write(f"{node.kind} (")
-        self._visit(node.expr)
-        self._writeln(")")
-
-        self.indent_level += 1
+        write = self.output.append
+        visit = self._visit
+        write(f"{node.kind} (")
+        visit(node.expr)
+        write(")\n")
+
+        level = self.indent_level
+        self.indent_level = level + 1
         for item in node.items:
-            self._visit(item)
+            visit(item)
 
         if node.default:
-            self._indent()
-            self._writeln("default: begin")
-            self.indent_level += 1
-            for stmt in node.default:
-                self._indent()
-                self._visit(stmt)
-            self.indent_level -= 1
-            self._indent()
-            self._writeln("end")
-
-        self.indent_level -= 1
-        self._indent()
-        self._writeln("endcase")
+            self._line("default: begin")
+            self._write_body(node.default, "end\n")
+
+        self.indent_level = level
+        write(self._indents[level] + "endcase\n")
 
     def _gen_CaseItem(self, node: CaseItem):
         """Generate case item."""
-        self._indent()
-        for i, val in enumerate(node.values):
-            if i > 0:
-                self._write(", ")
-            self._visit(val)
-        self._writeln(": begin")
-
-        self.indent_level += 1
-        for stmt in node.body:
-            self._indent()
-            self._visit(stmt)
-        self.indent_level -= 1
-
-        self._indent()
-        self._writeln("end")
+        write = self.output.append
+        write(self._indents[self.indent_level])
+        self._write_list(node.values)
+        write(": begin\n")
+        self._write_body(node.body, "end\n")
 
     def _gen_ForStatement(self, node: ForStatement):
         """Generate for loop."""
-        self._write("for (")
+        write = self.output.append
+        visit = self._visit
+        init = node.init
+        update = node.update
+        write("for (")
         # Init (without semicolon)
-        if isinstance(node.init, BlockingAssign):
-            self._visit(node.init.lhs)
-            self._write(" = ")
-            self._visit(node.init.rhs)
-        self._write("; ")
+        if isinstance(init, BlockingAssign):
+            visit(init.lhs)
+            write(" = ")
+            visit(init.rhs)
+        write("; ")
         # Condition
-        self._visit(node.cond)
-        self._write("; ")
+        visit(node.cond)
+        write("; ")
         # Update (without semicolon)
-        if isinstance(node.update, BlockingAssign):
-            self._visit(node.update.lhs)
-            self._write(" = ")
-            self._visit(node.update.rhs)
-        self._writeln(") begin")
+        if isinstance(update, BlockingAssign):
+            visit(update.lhs)
+            write(" = ")
+            visit(update.rhs)
+        write(") begin\n")
 
-        self.indent_level += 1
-        for stmt in node.body:
-            self._indent()
-            self._visit(stmt)
-        self.indent_level -= 1
-
-        self._indent()
-        self._writeln("end")
+        self._write_body(node.body, "end\n")
 
     def _gen_SystemTaskCall(self, node: SystemTaskCall):
         """Generate system task call."""
         self._write(node.name)
         if node.args:
             self._write("(")
-            for i, arg in enumerate(node.args):
-                if i > 0:
-                    self._write(", ")
-                self._visit(arg)
+            self._write_list(node.args)
             self._write(")")
-        self._writeln(";")
+        self._write(";\n")
 
     def _gen_Block(self, node: Block):
         """Generate begin/end block."""
         if node.name:
-            self._writeln(f"begin : {node.name}")
+            self._write(f"begin : {node.name}\n")
         else:
-            self._writeln("begin")
+            self._write("begin\n")
 
-        self.indent_level += 1
-        for stmt in node.stmts:
-            self._indent()
-            self._visit(stmt)
-        self.indent_level -= 1
-
-        self._indent()
-        self._writeln("end")
+        self._write_body(node.stmts, "end\n")
 
     # ============================================================
     # Expressions
@@ -478,30 +571,60 @@ class VerilogCodeGenerator:
         self._visit(node.operand)
 
     def _gen_BinaryOp(self, node: BinaryOp):
-        """Generate binary operation."""
-        self._write("(")
-        self._visit(node.left)
-        self._write(f" {node.op} ")
-        self._visit(node.right)
-        self._write(")")
+        """
+        Generate binary operation.
+
+        The parser builds left-associative chains (a + b + c ...) that nest
+        down the left operand. Such a chain is walked with a loop rather
+        than one recursion level per operator, so long chains neither pay
+        for a frame per operator nor run into the recursion limit.
+        """
+        write = self.output.append
+        visit = self._visit
+        if node.left.__class__ is not BinaryOp:
+            write("(")
+            visit(node.left)
+            write(_OP_TEXT.get(node.op) or f" {node.op} ")
+            visit(node.right)
+            write(")")
+            return
+
+        chain = []
+        while node.__class__ is BinaryOp:
+            chain.append(node)
+            node = node.left
+        write("(" * len(chain))
+        visit(node)
+        for op_node in reversed(chain):
+            write(_OP_TEXT.get(op_node.op) or f" {op_node.op} ")
+            visit(op_node.right)
+            write(")")
 
     def _gen_TernaryOp(self, node: TernaryOp):
-        """Generate ternary operation."""
-        self._write("(")
-        self._visit(node.cond)
-        self._write(" ? ")
-        self._visit(node.true_val)
-        self._write(" : ")
-        self._visit(node.false_val)
-        self._write(")")
+        """
+        Generate ternary operation.
+
+        Else-if style chains (a ? x : b ? y : z) nest down the false value;
+        like BinaryOp chains, they are walked with a loop.
+        """
+        write = self.output.append
+        visit = self._visit
+        depth = 0
+        while node.__class__ is TernaryOp:
+            write("(")
+            visit(node.cond)
+            write(" ? ")
+            visit(node.true_val)
+            write(" : ")
+            node = node.false_val
+            depth += 1
+        visit(node)
+        write(")" * depth)
 
     def _gen_Concat(self, node: Concat):
         """Generate concatenation."""
         self._write("{")
-        for i, part in enumerate(node.parts):
-            if i > 0:
-                self._write(", ")
-            self._visit(part)
+        self._write_list(node.parts)
         self._write("}")
 
     def _gen_Repeat(self, node: Repeat):
@@ -515,23 +638,47 @@ class VerilogCodeGenerator:
     def _gen_FuncCall(self, node: FuncCall):
         """Generate function call."""
         self._write(f"{node.name}(")
-        for i, arg in enumerate(node.args):
-            if i > 0:
-                self._write(", ")
-            self._visit(arg)
+        self._write_list(node.args)
         self._write(")")
 
 
-def generate_verilog(node: ASTNode, indent_str: str = "    ") -> str:
+_gen_identifier = VerilogCodeGenerator._gen_Identifier
+_gen_number_literal = VerilogCodeGenerator._gen_NumberLiteral
+_gen_string_literal = VerilogCodeGenerator._gen_StringLiteral
+_gen_port_decl = VerilogCodeGenerator._gen_PortDecl
+
+_idle = threading.local()
+
+
+def generate_verilog(node: ASTNode, indent_str: str = "    ",
+                     module_cache: Optional[dict] = None) -> str:
     """
     Generate Verilog code from an AST node.
 
     Args:
         node: The AST node to generate code from
         indent_str: String to use for indentation (default: 4 spaces)
+        module_cache: Optional dict, kept by the caller, that memoizes the
+            text of each Module node by identity. Pass the same dict to
+            repeated calls that re-emit the same modules; the cached text
+            goes stale if a module is modified, so only share it while the
+            AST is not being changed.
 
     Returns:
         Generated Verilog source code
     """
-    generator = VerilogCodeGenerator(indent_str=indent_str)
-    return generator.generate(node)
+    # Each thread keeps one idle generator to reuse. It is taken out while in
+    # use, so a nested call (e.g. from a subclass hook) builds its own.
+    generator = getattr(_idle, "generator", None)
+    if generator is None:
+        generator = VerilogCodeGenerator()
+    else:
+        _idle.generator = None
+    generator.indent_str = indent_str
+    generator.module_cache = module_cache
+    try:
+        return generator.generate(node)
+    finally:
+        generator.module_cache = None
+        generator.reset()
+        _idle.generator = generator
@@ -11,17 +11,204 @@ This is the first graph transformation: Tree (AST) → DAG (Netlist).
 """
 
 from __future__ import annotations
-from typing import Optional, Dict
+import operator
+from dataclasses import dataclass
+from typing import Callable, Optional, Dict
 from fpga_synth.hdl_parser.ast_nodes import *
 from fpga_synth.ir.netlist import Netlist, Cell, Net, Pin
 from fpga_synth.ir.types import CellOp, BitWidth, PortDir, NetType
 
 
+# Verilog operator → CellOp
+_BINOP_CELLOP = {
+    "&": CellOp.AND,
+    "|": CellOp.OR,
+    "^": CellOp.XOR,
+    "+": CellOp.ADD,
+    "-": CellOp.SUB,
+    "*": CellOp.MUL,
+    "==": CellOp.EQ,
+    "!=": CellOp.NEQ,
+    "<": CellOp.LT,
+    "<=": CellOp.LE,
+    ">": CellOp.GT,
+    ">=": CellOp.GE,
+    "<<": CellOp.SHL,
+    ">>": CellOp.SHR,
+}
+
+_UNOP_CELLOP = {
+    "~": CellOp.NOT,
+    "!": CellOp.NOT,  # Logical NOT - same as bitwise for single bit
+    "-": CellOp.NEG,
+    "&": CellOp.REDUCE_AND,
+    "|": CellOp.REDUCE_OR,
+    "^": CellOp.REDUCE_XOR,
+}
+
+# Lower-case op names used in generated cell and net names
+_CELLOP_LC = {op: op.name.lower() for op in CellOp}
+
+# Comparison and reduction operators return 1 bit
+_CMP_OPS = frozenset((CellOp.EQ, CellOp.NEQ, CellOp.LT, CellOp.LE, CellOp.GT, CellOp.GE))
+_REDUCE_OPS = frozenset((CellOp.REDUCE_AND, CellOp.REDUCE_OR, CellOp.REDUCE_XOR))
+
+# Binary operators whose operands can be swapped (for subexpression sharing)
+_COMMUTATIVE_OPS = frozenset((CellOp.AND, CellOp.OR, CellOp.XOR, CellOp.ADD, CellOp.MUL,
+                              CellOp.EQ, CellOp.NEQ))
+
+# BitWidth is frozen, so the common small widths are built once and shared
+_BW_SMALL = tuple(BitWidth.from_width(w) for w in range(65))
+_BW1 = _BW_SMALL[1]
+_INPUT = PortDir.INPUT
+
+# Write enable of memory writes without one; _elaborate_const interns its net
+_LIT_ONE = NumberLiteral(raw="1", value=1, width=1)
+
+# Expression nesting beyond which _elaborate_expr stops recursing
+_DEEP_EXPR_DEPTH = 200
+
+
+def _bitwidth(width: int) -> BitWidth:
+    """BitWidth.from_width, served from _BW_SMALL for widths up to 64."""
+    if 0 <= width < 65:
+        return _BW_SMALL[width]
+    return BitWidth.from_width(width)
+
+
+# Operators allowed in constant expressions (parameters, ranges)
+_CONST_EVAL = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.floordiv,
+    "%": operator.mod,
+    "&": operator.and_,
+    "|": operator.or_,
+    "^": operator.xor,
+    "<<": operator.lshift,
+    ">>": operator.rshift,
+}
+
+
+# Constant folding: what the cell for each operator computes, for operands
+# that are both literals. Results are masked to the cell's output width.
+# SHL is handled in _fold_binary, which knows that width.
+_FOLD_BINARY = {
+    CellOp.AND: operator.and_,
+    CellOp.OR: operator.or_,
+    CellOp.XOR: operator.xor,
+    CellOp.ADD: operator.add,
+    CellOp.SUB: operator.sub,
+    CellOp.MUL: operator.mul,
+    CellOp.EQ: operator.eq,
+    CellOp.NEQ: operator.ne,
+    CellOp.LT: operator.lt,
+    CellOp.LE: operator.le,
+    CellOp.GT: operator.gt,
+    CellOp.GE: operator.ge,
+    CellOp.SHR: operator.rshift,
+}
+
+
+def _fold_binary(cell_op: CellOp, left: NumberLiteral, right: NumberLiteral) -> NumberLiteral:
+    """Evaluate a binary operation on two literals, as its cell would."""
+    lw, rw = left.width, right.width
+    width = 1 if cell_op in _CMP_OPS else (lw if lw >= rw else rw)
+    if cell_op is CellOp.SHL:
+        # A shift by the width or more leaves no bits; capping it there
+        # keeps a huge shift amount from building a huge int
+        shift = right.value
+        value = left.value << shift if shift < width else 0
+    else:
+        value = int(_FOLD_BINARY[cell_op](left.value, right.value))
+    value &= (1 << width) - 1
+    return NumberLiteral(raw=f"{width}'d{value}", value=value, width=width)
+
+
+def _fold_unary(cell_op: CellOp, operand: NumberLiteral) -> NumberLiteral:
+    """Evaluate a unary operation on a literal, as its cell would."""
+    mask = (1 << operand.width) - 1
+    value = operand.value & mask
+    width = 1
+    if cell_op is CellOp.REDUCE_AND:
+        value = int(value == mask)
+    elif cell_op is CellOp.REDUCE_OR:
+        value = int(value != 0)
+    elif cell_op is CellOp.REDUCE_XOR:
+        value = bin(value).count("1") & 1
+    else:
+        width = operand.width
+        value = (~value if cell_op is CellOp.NOT else -value) & mask
+    return NumberLiteral(raw=f"{width}'d{value}", value=value, width=width)
+
+
 class ElaborationError(Exception):
     """Error during elaboration."""
     pass
 
 
+# A compiled constant expression: called with the elaborator, returns the value
+_ConstFn = Callable[["Elaborator"], int]
+
+
+def _compile_const_expr(expr: Expr) -> _ConstFn:
+    """
+    Compile a constant-expression tree into nested closures.
+
+    Literals and binary operators are compiled directly; parameter
+    references call _eval_const_identifier and any other node goes through
+    _eval_const_expr when the closure runs. Left-associative chains become
+    one closure that loops over the chain, as in _elaborate_binary_op.
+    """
+    cls = expr.__class__
+    if cls is NumberLiteral:
+        value = expr.value
+        return lambda elab: value
+
+    if cls is Identifier:
+        return lambda elab: elab._eval_const_identifier(expr)
+
+    if cls is not BinaryOp:
+        return lambda elab: elab._eval_const_expr(expr)
+
+    chain = [expr]
+    node = expr.left
+    while node.__class__ is BinaryOp:
+        chain.append(node)
+        node = node.left
+
+    first = _compile_const_expr(node)
+    steps = []
+    for op_node in reversed(chain):
+        op = _CONST_EVAL.get(op_node.op)
+        if op is None:
+            raise ElaborationError(f"Cannot evaluate non-constant expression: {type(op_node).__name__}")
+        steps.append((op, _compile_const_expr(op_node.right)))
+
+    if len(steps) == 1:
+        (op, right), = steps
+        return lambda elab: op(first(elab), right(elab))
+
+    def chain_fn(elab: Elaborator) -> int:
+        value = first(elab)
+        for op, right in steps:
+            value = op(value, right(elab))
+        return value
+    return chain_fn
+
+
+@dataclass(slots=True)
+class _SequentialContext:
+    """Clock/reset setup of one sequential always block, derived once."""
+    clk_signal: str
+    rst_signal: Optional[str]
+    rst_polarity: Optional[str]
+    cell_op: CellOp                # DFFR with a reset, else DFF
+    clk_net: Optional[Net]
+    rst_net: Optional[Net]
+
+
 class Elaborator:
     """
     Elaborates an AST into a netlist.
@@ -30,12 +217,57 @@ class Elaborator:
     Future: Module hierarchy, sequential logic, memories.
     """
 
-    def __init__(self):
+    # Expression node class → handler method name. _elaborate_expr and
+    # _eval_const_expr resolve these once per node class into the per-class
+    # dispatch dicts below, so each visit is a single dict lookup.
+    _EXPR_HANDLERS = {
+        NumberLiteral: "_elaborate_const",
+        Identifier: "_elaborate_identifier",
+        BinaryOp: "_elaborate_binary_op",
+        UnaryOp: "_elaborate_unary_op",
+        TernaryOp: "_elaborate_ternary_op",
+        Concat: "_elaborate_concat",
+        BitSelect: "_elaborate_bit_select",
+    }
+    _CONST_HANDLERS = {
+        NumberLiteral: "_eval_const_number",
+        Identifier: "_eval_const_identifier",
+        BinaryOp: "_eval_const_binary_op",
+    }
+
+    # Per-elaborator-class caches: node class → unbound handler.
+    # Each subclass gets its own dicts via __init_subclass__.
+    _expr_dispatch: dict[type, Callable] = {}
+    _const_dispatch: dict[type, Callable] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._expr_dispatch = {}
+        cls._const_dispatch = {}
+
+    __slots__ = ("netlist", "net_map", "parameters", "memories", "module_library",
+                 "fold_constants", "share_subexpressions", "_decl_widths", "_const_cache",
+                 "_expr_cache", "_expr_keys", "_const_eval_cache", "_const_fn_cache",
+                 "_mem_serial", "_expr_depth", "_deep_nets", "_deep_consts")
+
+    def __init__(self, fold_constants: bool = True, share_subexpressions: bool = True):
+        self.fold_constants = fold_constants  # operators on literals → one CONST cell
+        self.share_subexpressions = share_subexpressions  # identical cells → one cell
         self.netlist: Optional[Netlist] = None
         self.net_map: Dict[str, Net] = {}  # signal name → Net
+        self._decl_widths: Dict[str, BitWidth] = {}  # declared signal → width
         self.parameters: Dict[str, int] = {}  # parameter name → value
         self.memories: Dict[str, tuple[BitWidth, int]] = {}  # memory name → (data_width, depth)
         self.module_library: Dict[str, Module] = {}  # module_name → Module AST
+        self._const_cache: Dict[tuple[int, int], Net] = {}  # (value, width) → CONST output net
+        self._expr_cache: Dict[tuple, Net] = {}  # (op, *input net ids, *attributes) → output net
+        self._expr_keys: Dict[int, tuple] = {}  # output net id → its _expr_cache key
+        self._const_eval_cache: Dict[int, tuple[Expr, int]] = {}  # id(expr) → (expr, value)
+        self._const_fn_cache: Dict[int, tuple[Expr, _ConstFn]] = {}  # id(expr) → (expr, compiled)
+        self._mem_serial = 0  # numbers MEMRD/MEMWR cell names within a module
+        self._expr_depth = 0  # nesting of _elaborate_expr calls
+        self._deep_nets: Optional[Dict[int, Net]] = None  # id(expr) → net, see _elaborate_deep
+        self._deep_consts: Optional[Dict[int, Optional[NumberLiteral]]] = None  # id(expr) → folded
 
     def elaborate(self, ast: SourceFile, top_module: Optional[str] = None) -> Netlist:
         """
@@ -56,6 +288,7 @@ class Elaborator:
 
         # Build module library
         self.module_library = {}
+        self._const_fn_cache = {}
         for module in ast.modules:
             self.module_library[module.name] = module
 
@@ -74,24 +307,50 @@ class Elaborator:
         """Elaborate a single module."""
         self.netlist = Netlist(name=module.name)
         self.net_map = {}
+        self._decl_widths = {}
         self.parameters = {}
         self.memories = {}
+        self._const_cache = {}
+        self._expr_cache = {}
+        self._expr_keys = {}
+        self._const_eval_cache = {}
+        self._mem_serial = 0
+        self._expr_depth = 0
+
+        # Sort the body items in one pass; the phases below then only visit
+        # the items they handle, in source order.
+        local_params = []
+        decls = []
+        logic = []  # (handler, item)
+        for item in module.body:
+            if isinstance(item, NetDecl):
+                decls.append(item)
+            elif isinstance(item, ContinuousAssign):
+                logic.append((self._elaborate_assign, item))
+            elif isinstance(item, AlwaysBlock):
+                logic.append((self._elaborate_always_block, item))
+            elif isinstance(item, ModuleInstance):
+                logic.append((self._elaborate_module_instance, item))
+            elif isinstance(item, ParamDecl):
+                local_params.append(item)
+            # TODO: InitialBlock, etc.
 
         # Phase 1: Resolve parameters
-        self._resolve_parameters(module)
+        self._resolve_parameters(module, local_params)
 
         # Phase 2: Create primary I/O
         self._elaborate_ports(module)
 
-        # Phase 3: Create nets for declared signals
-        self._elaborate_declarations(module)
+        # Phase 3: Record declared signals (their nets are created on first use)
+        self._elaborate_declarations(decls)
 
-        # Phase 4: Elaborate module body
-        self._elaborate_body(module)
+        # Phase 4: Elaborate module logic
+        for handler, item in logic:
+            handler(item)
 
         return self.netlist
 
-    def _resolve_parameters(self, module: Module):
+    def _resolve_parameters(self, module: Module, local_params: list[ParamDecl]):
         """Resolve all parameter values."""
         # Module-level parameters
         for param in module.params:
@@ -99,8 +358,8 @@ class Elaborator:
                 self.parameters[param.name] = self._eval_const_expr(param.value)
 
         # Body parameters (localparam)
-        for item in module.body:
-            if isinstance(item, ParamDecl) and item.value:
+        for item in local_params:
+            if item.value:
                 self.parameters[item.name] = self._eval_const_expr(item.value)
 
     def _elaborate_ports(self, module: Module):
@@ -134,42 +393,28 @@ class Elaborator:
                 self.netlist.add_net(net)
                 self.net_map[port.name] = net
 
-    def _elaborate_declarations(self, module: Module):
-        """Create nets for wire/reg declarations and detect memory arrays."""
-        for item in module.body:
-            if isinstance(item, NetDecl):
-                width = self._get_width(item.range)
-
-                # Check if this is a memory array (has unpacked dimensions)
-                if item.array_dims:
-                    # This is a memory array: reg [7:0] mem [0:255]
-                    # Extract depth from first dimension
-                    depth_range = item.array_dims[0]
-                    dim_high = self._eval_const_expr(depth_range.msb)
-                    dim_low = self._eval_const_expr(depth_range.lsb)
-                    depth = abs(dim_high - dim_low) + 1
-
-                    # Register as memory
-                    self.memories[item.name] = (width, depth)
-                    # Note: We don't create a single net for the memory
-                    # Instead, each access creates MEMRD/MEMWR cells
-                else:
-                    # Regular signal - create net if not already created (e.g., by port)
-                    if item.name not in self.net_map:
-                        net = Net(name=item.name, width=width)
-                        self.netlist.add_net(net)
-                        self.net_map[item.name] = net
-
-    def _elaborate_body(self, module: Module):
-        """Elaborate all module body items."""
-        for item in module.body:
-            if isinstance(item, ContinuousAssign):
-                self._elaborate_assign(item)
-            elif isinstance(item, AlwaysBlock):
-                self._elaborate_always_block(item)
-            elif isinstance(item, ModuleInstance):
-                self._elaborate_module_instance(item)
-            # TODO: InitialBlock, etc.
+    def _elaborate_declarations(self, decls: list[NetDecl]):
+        """Record wire/reg widths and detect memory arrays."""
+        for item in decls:
+            width = self._get_width(item.range)
+
+            # Check if this is a memory array (has unpacked dimensions)
+            if item.array_dims:
+                # This is a memory array: reg [7:0] mem [0:255]
+                # Extract depth from first dimension
+                depth_range = item.array_dims[0]
+                dim_high = self._eval_const_expr(depth_range.msb)
+                dim_low = self._eval_const_expr(depth_range.lsb)
+                depth = abs(dim_high - dim_low) + 1
+
+                # Register as memory
+                self.memories[item.name] = (width, depth)
+                # Note: We don't create a single net for the memory
+                # Instead, each access creates MEMRD/MEMWR cells
+            else:
+                # Regular signal - its net is created by _lookup_net when
+                # first referenced, so unused declarations cost nothing
+                self._decl_widths[item.name] = width
 
     def _elaborate_module_instance(self, inst: ModuleInstance):
         """
@@ -191,8 +436,10 @@ class Elaborator:
         parent_memories = self.memories
 
         # Create new context for child module
-        child_elaborator = Elaborator()
+        child_elaborator = Elaborator(fold_constants=self.fold_constants,
+                                      share_subexpressions=self.share_subexpressions)
         child_elaborator.module_library = self.module_library
+        child_elaborator._const_fn_cache = self._const_fn_cache
 
         # Override parameters if provided
         child_parameters = {}
@@ -300,24 +547,39 @@ class Elaborator:
         if not isinstance(assign.lhs, Identifier):
             raise ElaborationError(f"LHS of assign must be identifier, got {type(assign.lhs).__name__}")
 
-        lhs_name = assign.lhs.name
-        if lhs_name not in self.net_map:
-            # Create net if it doesn't exist (implicit wire declaration)
-            net = Net(name=lhs_name, width=BitWidth(0, 0))
-            self.netlist.add_net(net)
-            self.net_map[lhs_name] = net
-
-        lhs_net = self.net_map[lhs_name]
+        # Create net if it doesn't exist (implicit wire declaration)
+        lhs_net = self._get_or_create_net(assign.lhs.name)
 
         # Elaborate RHS expression to get output net
         rhs_net = self._elaborate_expr(assign.rhs)
 
         # Connect RHS output to LHS
-        # If RHS driver exists, connect it to LHS net
-        if rhs_net.driver:
-            lhs_net.set_driver(rhs_net.driver)
-            # Update driver pin's net to point to LHS net
-            rhs_net.driver.net = lhs_net
+        self._move_driver(rhs_net, lhs_net)
+
+    def _move_driver(self, rhs_net: Net, lhs_net: Net):
+        """Make the driver of ``rhs_net`` (if any) drive ``lhs_net`` instead."""
+        driver = rhs_net.driver
+        if not driver:
+            return
+        lhs_net.set_driver(driver)
+
+        # A shared constant or subexpression net loses its driver here: take
+        # it out of its cache, and move any sinks it already had along with
+        # the driver.
+        cell = driver.cell
+        if cell is not None and cell.op is CellOp.CONST:
+            key = (cell.attributes["value"], cell.attributes["width"])
+            if self._const_cache.get(key) is not rhs_net:
+                return
+            del self._const_cache[key]
+        else:
+            key = self._expr_keys.pop(rhs_net.id, None)
+            if key is None:
+                return
+            del self._expr_cache[key]
+        for pin in rhs_net.sinks:
+            lhs_net.add_sink(pin)
+        rhs_net.sinks.clear()
 
     def _elaborate_always_block(self, always: AlwaysBlock):
         """
@@ -327,24 +589,30 @@ class Elaborator:
         - @(posedge clk) or @(negedge rst) → Sequential (creates DFF cells)
         - @(*) → Combinational (elaborates as continuous logic)
         """
-        # Check if this is sequential (has edge-sensitive signals)
-        has_edge = any(sens.edge in ('posedge', 'negedge') for sens in always.sensitivity)
-
-        if has_edge:
-            self._elaborate_sequential_always(always)
+        ctx = self._sequential_context(always)
+        if ctx is not None:
+            self._elaborate_sequential_body(always.body, ctx)
         else:
             # Combinational always block - elaborate as continuous assignments
             self._elaborate_combinational_always(always)
 
-    def _elaborate_sequential_always(self, always: AlwaysBlock):
-        """Elaborate sequential always block with flip-flops."""
+    def _sequential_context(self, always: AlwaysBlock) -> Optional[_SequentialContext]:
+        """
+        Classify the sensitivity list in one pass.
+
+        Returns None for a block without edge-sensitive signals; otherwise
+        the clock/reset signals, their nets and the DFF type shared by every
+        register the block assigns.
+        """
         # Find clock and reset signals
         clk_signal = None
         rst_signal = None
         rst_polarity = None  # 'posedge' or 'negedge'
+        has_edge = False
 
         for sens in always.sensitivity:
             if sens.edge == 'posedge':
+                has_edge = True
                 if 'clk' in sens.signal.name.lower():
                     clk_signal = sens.signal.name
                 else:
@@ -352,53 +620,53 @@ class Elaborator:
                     if clk_signal is None:
                         clk_signal = sens.signal.name
             elif sens.edge == 'negedge':
+                has_edge = True
                 # Usually reset
                 rst_signal = sens.signal.name
                 rst_polarity = 'negedge'
 
+        if not has_edge:
+            return None
         if not clk_signal:
             raise ElaborationError("Sequential always block must have a clock signal")
 
-        # Analyze the always block body to find register assignments
-        # For now, simple case: direct non-blocking assignments
-        for stmt in always.body:
-            if isinstance(stmt, NonBlockingAssign):
-                self._create_dff(stmt, clk_signal, rst_signal, rst_polarity)
-            elif isinstance(stmt, IfStatement):
-                # Handle if statement (possibly reset logic)
-                self._elaborate_sequential_if(stmt, clk_signal, rst_signal, rst_polarity)
+        return _SequentialContext(
+            clk_signal=clk_signal,
+            rst_signal=rst_signal,
+            rst_polarity=rst_polarity,
+            cell_op=CellOp.DFFR if rst_signal else CellOp.DFF,
+            clk_net=self._lookup_net(clk_signal),
+            rst_net=self._lookup_net(rst_signal) if rst_signal else None,
+        )
 
-    def _elaborate_sequential_if(self, if_stmt: IfStatement, clk_signal: str,
-                                   rst_signal: Optional[str], rst_polarity: Optional[str]):
+    def _elaborate_sequential_if(self, if_stmt: IfStatement, ctx: _SequentialContext):
         """Elaborate if statement in sequential context (handles reset)."""
         # Check if condition is reset check
-        is_reset_check = False
-        if rst_signal and isinstance(if_stmt.cond, UnaryOp):
-            if if_stmt.cond.op == '!' and isinstance(if_stmt.cond.operand, Identifier):
-                if if_stmt.cond.operand.name == rst_signal:
-                    is_reset_check = True
+        cond = if_stmt.cond
+        is_reset_check = (ctx.rst_signal is not None and isinstance(cond, UnaryOp)
+                          and cond.op == '!' and isinstance(cond.operand, Identifier)
+                          and cond.operand.name == ctx.rst_signal)
 
         if is_reset_check:
             # Then branch is reset, else branch is normal operation
             # Process else branch recursively
-            self._elaborate_sequential_body(if_stmt.else_body, clk_signal, rst_signal, rst_polarity)
+            self._elaborate_sequential_body(if_stmt.else_body, ctx)
         else:
             # Not a reset check - this could be enable logic
             # Process then branch recursively
-            self._elaborate_sequential_body(if_stmt.then_body, clk_signal, rst_signal, rst_polarity)
+            self._elaborate_sequential_body(if_stmt.then_body, ctx)
             # Note: For proper enable, we'd need DFFRE (DFF with reset and enable)
 
-    def _elaborate_sequential_body(self, stmts: list, clk_signal: str,
-                                     rst_signal: Optional[str], rst_polarity: Optional[str]):
+    def _elaborate_sequential_body(self, stmts: list, ctx: _SequentialContext):
         """Recursively elaborate statements in a sequential context."""
         for stmt in stmts:
             if isinstance(stmt, NonBlockingAssign):
-                self._create_dff(stmt, clk_signal, rst_signal, rst_polarity)
+                self._create_dff(stmt, ctx)
             elif isinstance(stmt, IfStatement):
-                self._elaborate_sequential_if(stmt, clk_signal, rst_signal, rst_polarity)
+                # Handle if statement (possibly reset logic)
+                self._elaborate_sequential_if(stmt, ctx)
 
-    def _create_dff(self, assign: NonBlockingAssign, clk_signal: str,
-                    rst_signal: Optional[str], rst_polarity: Optional[str]):
+    def _create_dff(self, assign: NonBlockingAssign, ctx: _SequentialContext):
         """Create a DFF cell for a register assignment or memory write."""
         # Check if LHS is a memory write: mem[addr] <= data
         if isinstance(assign.lhs, BitSelect):
@@ -408,7 +676,7 @@ class Elaborator:
                     mem_name=assign.lhs.target.name,
                     addr_expr=assign.lhs.msb,
                     data_expr=assign.rhs,
-                    clk_signal=clk_signal
+                    clk_net=ctx.clk_net
                 )
                 return
 
@@ -417,38 +685,26 @@ class Elaborator:
 
         reg_name = assign.lhs.name
 
-        # Determine DFF type
-        if rst_signal:
-            cell_op = CellOp.DFFR  # DFF with reset
-        else:
-            cell_op = CellOp.DFF   # Simple DFF
-
-        # Create DFF cell
-        cell = Cell(name=f"dff_{reg_name}", op=cell_op)
+        # Create DFF cell (DFFR when the block has a reset)
+        cell = Cell(name=f"dff_{reg_name}", op=ctx.cell_op)
 
         # Get register net (should already exist from declaration)
-        if reg_name not in self.net_map:
-            # Create net if not declared
-            net = Net(name=reg_name, width=BitWidth(0, 0))
-            self.netlist.add_net(net)
-            self.net_map[reg_name] = net
-
-        reg_net = self.net_map[reg_name]
+        reg_net = self._get_or_create_net(reg_name)
 
         # Add pins
-        clk_pin = cell.add_input("CLK", BitWidth(0, 0))
+        clk_pin = cell.add_input("CLK", _BW1)
         d_pin = cell.add_input("D", reg_net.width)
         q_pin = cell.add_output("Q", reg_net.width)
 
-        if rst_signal:
-            rst_pin = cell.add_input("RST", BitWidth(0, 0))
+        if ctx.rst_signal:
+            rst_pin = cell.add_input("RST", _BW1)
             # Connect reset signal
-            if rst_signal in self.net_map:
-                self.net_map[rst_signal].add_sink(rst_pin)
+            if ctx.rst_net is not None:
+                ctx.rst_net.add_sink(rst_pin)
 
         # Connect clock
-        if clk_signal in self.net_map:
-            self.net_map[clk_signal].add_sink(clk_pin)
+        if ctx.clk_net is not None:
+            ctx.clk_net.add_sink(clk_pin)
 
         # Elaborate RHS to get D input
         rhs_net = self._elaborate_expr(assign.rhs)
@@ -476,61 +732,193 @@ class Elaborator:
         lhs_name = assign.lhs.name
 
         # Get or create LHS net
-        if lhs_name not in self.net_map:
-            net = Net(name=lhs_name, width=BitWidth(0, 0))
-            self.netlist.add_net(net)
-            self.net_map[lhs_name] = net
-
-        lhs_net = self.net_map[lhs_name]
+        lhs_net = self._get_or_create_net(lhs_name)
 
         # Elaborate RHS
         rhs_net = self._elaborate_expr(assign.rhs)
 
         # Connect
-        if rhs_net.driver:
-            lhs_net.set_driver(rhs_net.driver)
-            rhs_net.driver.net = lhs_net
+        self._move_driver(rhs_net, lhs_net)
 
     def _elaborate_expr(self, expr: Expr) -> Net:
         """
         Elaborate an expression into cells.
 
-        Returns the net containing the expression's output.
+        Returns the net containing the expression's output. Handlers recurse
+        through here for their operands; past _DEEP_EXPR_DEPTH levels the
+        rest of the tree is handed to _elaborate_deep instead.
         """
-        if isinstance(expr, NumberLiteral):
-            return self._elaborate_const(expr)
-
-        elif isinstance(expr, Identifier):
-            # Reference to existing signal
-            if expr.name not in self.net_map:
-                raise ElaborationError(f"Undefined signal: {expr.name}")
-            return self.net_map[expr.name]
-
-        elif isinstance(expr, BinaryOp):
-            return self._elaborate_binary_op(expr)
+        deep_nets = self._deep_nets
+        if deep_nets is not None:
+            net = deep_nets.get(id(expr))
+            if net is not None:
+                return net
+        handler = self._expr_dispatch.get(expr.__class__)
+        if handler is None:
+            handler = self._resolve_handler(expr, self._EXPR_HANDLERS, self._expr_dispatch,
+                                            "Unsupported expression type")
+        depth = self._expr_depth
+        if depth >= _DEEP_EXPR_DEPTH and deep_nets is None:
+            return self._elaborate_deep(expr)
+        self._expr_depth = depth + 1
+        net = handler(self, expr)
+        self._expr_depth = depth
+        return net
 
+    def _elaborate_deep(self, expr: Expr) -> Net:
+        """
+        Elaborate a deeply nested expression without deep recursion.
+
+        Operand subtrees are visited in post-order with an explicit stack,
+        and each node's net is recorded in _deep_nets before its parent is
+        elaborated. A handler's calls for its operands are then answered
+        from that table, so no call nests more than one level. Only trees
+        nested past _DEEP_EXPR_DEPTH take this path; the cell order is
+        bottom-up rather than the handlers' own order, but the cells built
+        are the same: operands the handler would fold or not select are not
+        visited.
+        """
+        deep_nets = self._deep_nets = {}
+        self._deep_consts = {}
+        saved_depth = self._expr_depth
+        self._expr_depth = 0
+        try:
+            stack = [(expr, False)]
+            while stack:
+                node, expanded = stack.pop()
+                if expanded:
+                    deep_nets[id(node)] = self._elaborate_expr(node)
+                    continue
+                stack.append((node, True))
+                for operand in reversed(self._expr_operands(node)):
+                    if id(operand) not in deep_nets:
+                        stack.append((operand, False))
+            return deep_nets[id(expr)]
+        finally:
+            self._deep_nets = self._deep_consts = None
+            self._expr_depth = saved_depth
+
+    def _expr_operands(self, expr: Expr) -> list:
+        """The subexpressions an expression's handler elaborates into nets.
+
+        BinaryOp and TernaryOp chains are taken whole, as their handlers
+        loop over them. Identifiers and literals are left out: they resolve
+        without recursion. With fold_constants, the operands the handler
+        folds and the branches a constant condition does not select are
+        left out too.
+        """
+        fold = self.fold_constants
+        if isinstance(expr, BinaryOp):
+            rights = []
+            node = expr
+            while node.__class__ is BinaryOp:
+                rights.append(node.right)
+                node = node.left
+            rights.append(node)
+            rights.reverse()
+            operands = rights
+            if fold:
+                # The constant prefix of the chain is folded
+                i = 0
+                while i < len(operands) and self._try_const_fold(operands[i]) is not None:
+                    i += 1
+                operands = operands[i:]
         elif isinstance(expr, UnaryOp):
-            return self._elaborate_unary_op(expr)
-
+            operands = [expr.operand]
+            if fold and self._try_const_fold(expr.operand) is not None:
+                return []
         elif isinstance(expr, TernaryOp):
-            return self._elaborate_ternary_op(expr)
-
+            operands = []
+            node = expr
+            while node.__class__ is TernaryOp:
+                cond_lit = self._try_const_fold(node.cond) if fold else None
+                if cond_lit is not None:
+                    if self._try_const_fold(node) is not None:
+                        return operands
+                    if cond_lit.value:
+                        node = node.true_val
+                        break
+                else:
+                    operands += (node.cond, node.true_val)
+                node = node.false_val
+            operands.append(node)
         elif isinstance(expr, Concat):
-            return self._elaborate_concat(expr)
-
+            operands = expr.parts
         elif isinstance(expr, BitSelect):
-            return self._elaborate_bit_select(expr)
-
+            target = expr.target
+            if isinstance(target, Identifier) and target.name in self.memories:
+                operands = [expr.msb]  # Memory read: the address is elaborated
+            else:
+                operands = [target]
         else:
-            raise ElaborationError(f"Unsupported expression type: {type(expr).__name__}")
+            return []
+        return [op for op in operands
+                if op is not None and not isinstance(op, (Identifier, NumberLiteral))]
+
+    def _resolve_handler(self, expr: Expr, handlers: dict, dispatch: dict, error: str) -> Callable:
+        """Find the handler for a node class not yet in ``dispatch`` and memoize it.
+
+        Subclasses of the known node classes resolve through their MRO.
+        Dispatch misses land here, so this is also where unsupported node
+        classes are reported, keeping the raise off the dispatch fast path.
+        """
+        for cls in expr.__class__.__mro__:
+            name = handlers.get(cls)
+            if name is not None:
+                handler = getattr(type(self), name)
+                dispatch[expr.__class__] = handler
+                return handler
+        raise ElaborationError(f"{error}: {type(expr).__name__}")
+
+    def _elaborate_identifier(self, expr: Identifier) -> Net:
+        """Reference to an existing signal, or a parameter's constant."""
+        net = self.net_map.get(expr.name)
+        if net is None:
+            net = self._lookup_net(expr.name)
+            if net is None:
+                lit = self._parameter_literal(expr)
+                if lit is None:
+                    raise ElaborationError(f"Undefined signal: {expr.name}")
+                net = self._elaborate_const(lit)
+        return net
+
+    def _lookup_net(self, name: str) -> Optional[Net]:
+        """Net for a port or declared signal (created on first use), else None."""
+        net = self.net_map.get(name)
+        if net is None:
+            width = self._decl_widths.get(name)
+            if width is not None:
+                net = Net(name=name, width=width)
+                self.netlist.add_net(net)
+                self.net_map[name] = net
+        return net
+
+    def _get_or_create_net(self, name: str) -> Net:
+        """Look up a signal's net, creating an implicit 1-bit net if undeclared."""
+        net = self._lookup_net(name)
+        if net is None:
+            net = Net(name=name, width=_BW1)
+            self.netlist.add_net(net)
+            self.net_map[name] = net
+        return net
 
     def _elaborate_const(self, lit: NumberLiteral) -> Net:
-        """Create a CONST cell for a number literal."""
+        """
+        Create a CONST cell for a number literal.
+
+        Literals are interned per module by (value, width): every use of the
+        same constant reads the one CONST cell's output net.
+        """
+        key = (lit.value, lit.width)
+        net = self._const_cache.get(key)
+        if net is not None:
+            return net
+
         cell = Cell(name=f"const_{lit.value}", op=CellOp.CONST)
         cell.attributes["value"] = lit.value
         cell.attributes["width"] = lit.width
 
-        width = BitWidth.from_width(lit.width)
+        width = _bitwidth(lit.width)
         out_pin = cell.add_output("Y", width)
 
         self.netlist.add_cell(cell)
@@ -540,165 +928,281 @@ class Elaborator:
         net.set_driver(out_pin)
         self.netlist.add_net(net)
 
+        self._const_cache[key] = net
         return net
 
+    def _parameter_literal(self, expr: Identifier) -> Optional[NumberLiteral]:
+        """The value of a parameter reference as an (unsized, 32-bit) literal."""
+        value = self.parameters.get(expr.name)
+        if value is None:
+            return None
+        value &= 0xFFFFFFFF
+        return NumberLiteral(raw=f"32'd{value}", value=value, width=32)
+
+    def _as_literal(self, node: Expr) -> Optional[NumberLiteral]:
+        """``node`` itself if it is a literal, a parameter's value, else None."""
+        cls = node.__class__
+        if cls is NumberLiteral:
+            return node
+        if cls is Identifier:
+            return self._parameter_literal(node)
+        return None
+
+    def _try_const_fold(self, expr: Expr) -> Optional[NumberLiteral]:
+        """
+        Evaluate an operator tree whose leaves are all literals or parameters.
+
+        Returns the literal a chain of folded cells would produce (same
+        widths and truncation as _fold_binary / _fold_unary), or None as
+        soon as a leaf turns out not to be constant. Leaves are visited left
+        to right with an explicit stack, so trees of any depth are handled;
+        pending operators sit on the same stack as (node class, cell op,
+        node) tuples. Inside _elaborate_deep every subtree's result is
+        recorded in _deep_consts, so each node there is evaluated once.
+        """
+        cls = expr.__class__
+        if cls is Identifier or cls is NumberLiteral:
+            return self._as_literal(expr)
+        known = self._deep_consts
+        values = []
+        stack = [expr]
+        while stack:
+            item = stack.pop()
+            if item.__class__ is tuple:
+                kind, cell_op, node = item
+                if kind is BinaryOp:
+                    right = values.pop()
+                    values[-1] = _fold_binary(cell_op, values[-1], right)
+                elif kind is UnaryOp:
+                    values[-1] = _fold_unary(cell_op, values[-1])
+                else:
+                    false_lit = values.pop()
+                    true_lit = values.pop()
+                    chosen = true_lit if values[-1].value else false_lit
+                    tw, fw = true_lit.width, false_lit.width
+                    values[-1] = NumberLiteral(raw=chosen.raw, value=chosen.value,
+                                               width=tw if tw >= fw else fw)
+                if known is not None:
+                    known[id(node)] = values[-1]
+                continue
+
+            lit = None
+            if known is not None and id(item) in known:
+                lit = known[id(item)]
+            else:
+                cls = item.__class__
+                if cls is BinaryOp:
+                    cell_op = _BINOP_CELLOP.get(item.op)
+                    if cell_op is not None:
+                        stack += ((BinaryOp, cell_op, item), item.right, item.left)
+                        continue
+                elif cls is UnaryOp:
+                    cell_op = _UNOP_CELLOP.get(item.op)
+                    if cell_op is not None:
+                        stack += ((UnaryOp, cell_op, item), item.operand)
+                        continue
+                elif cls is TernaryOp:
+                    stack += ((TernaryOp, None, item), item.false_val, item.true_val, item.cond)
+                    continue
+                else:
+                    lit = self._as_literal(item)
+            if lit is None:
+                if known is not None:
+                    # The item and every operator still pending above it
+                    # are not constant
+                    known[id(item)] = None
+                    for pending in stack:
+                        if pending.__class__ is tuple:
+                            known[id(pending[2])] = None
+                return None
+            values.append(lit)
+        return values[0]
+
     def _elaborate_binary_op(self, expr: BinaryOp) -> Net:
-        """Elaborate a binary operation."""
-        # Map Verilog operators to CellOp
-        op_map = {
-            "&": CellOp.AND,
-            "|": CellOp.OR,
-            "^": CellOp.XOR,
-            "+": CellOp.ADD,
-            "-": CellOp.SUB,
-            "*": CellOp.MUL,
-            "==": CellOp.EQ,
-            "!=": CellOp.NEQ,
-            "<": CellOp.LT,
-            "<=": CellOp.LE,
-            ">": CellOp.GT,
-            ">=": CellOp.GE,
-            "<<": CellOp.SHL,
-            ">>": CellOp.SHR,
-        }
-
-        if expr.op not in op_map:
-            raise ElaborationError(f"Unsupported binary operator: {expr.op}")
-
-        cell_op = op_map[expr.op]
-
-        # Elaborate operands
-        left_net = self._elaborate_expr(expr.left)
-        right_net = self._elaborate_expr(expr.right)
-
-        # Create cell
-        cell = Cell(name=f"{cell_op.name.lower()}_{left_net.name}_{right_net.name}", op=cell_op)
-
-        # Determine output width (simplified - needs proper width inference)
-        out_width = max(left_net.width.width, right_net.width.width)
-        if cell_op in (CellOp.EQ, CellOp.NEQ, CellOp.LT, CellOp.LE, CellOp.GT, CellOp.GE):
-            out_width = 1  # Comparison operators return 1 bit
+        """
+        Elaborate a binary operation.
 
-        # Add pins
-        a_pin = cell.add_input("A", left_net.width)
-        b_pin = cell.add_input("B", right_net.width)
-        y_pin = cell.add_output("Y", BitWidth.from_width(out_width))
+        The parser builds left-associative chains (a + b + c ...) that nest
+        down the left operand. Such a chain is elaborated with a loop,
+        innermost operator first, so long chains do not run into the
+        recursion limit. Cells are created in the same order as a recursive
+        walk would create them.
 
-        # Connect inputs
-        left_net.add_sink(a_pin)
-        right_net.add_sink(b_pin)
+        With fold_constants, a constant prefix of a chain is folded into
+        one literal, so a tree made only of literals and parameters becomes
+        a single CONST cell.
+        """
+        fold = self.fold_constants
+        chain = []
+        node = expr
+        while True:
+            cell_op = _BINOP_CELLOP.get(node.op)
+            if cell_op is None:
+                raise ElaborationError(f"Unsupported binary operator: {node.op}")
+            chain.append((node.right, cell_op))
+            node = node.left
+            if node.__class__ is not BinaryOp:
+                break
+
+        elaborate_expr = self._elaborate_expr
+        emit = self._emit
+
+        # Operators whose operands are both constant are folded into one
+        # literal, for as long as the chain so far is constant
+        lit = self._try_const_fold(node) if fold else None
+        net = None if lit is not None else elaborate_expr(node)
+        for right, cell_op in reversed(chain):
+            if lit is not None:
+                right_lit = self._try_const_fold(right)
+                if right_lit is not None:
+                    lit = _fold_binary(cell_op, lit, right_lit)
+                    continue
+                net = self._elaborate_const(lit)
+                lit = None
+            right_net = elaborate_expr(right)
+            if cell_op in _CMP_OPS:
+                out_bw = _BW1  # Comparison operators return 1 bit
+            else:
+                lw, rw = net.width.width, right_net.width.width
+                out_bw = _bitwidth(lw if lw >= rw else rw)
+            net = emit(cell_op, f"{_CELLOP_LC[cell_op]}_{net.name}_{right_net.name}",
+                       (("A", net), ("B", right_net)), out_bw)
+        if lit is not None:
+            net = self._elaborate_const(lit)
+        return net
 
-        self.netlist.add_cell(cell)
+    def _emit(self, cell_op: CellOp, name: str, inputs: tuple[tuple[str, Net], ...],
+              out_bw: BitWidth, attributes: Optional[dict] = None) -> Net:
+        """
+        Create a cell driving a new output net.
 
-        # Create output net
-        out_net = Net(name=f"_{cell.op.name.lower()}_{cell.id}", width=BitWidth.from_width(out_width))
+        ``inputs`` gives the (pin name, net) pairs, in pin order. The output
+        pin is "Y", and the net is named after the op and the cell id.
+
+        With share_subexpressions, a cell identical to one already emitted
+        in this module (same op, input nets and attributes) is
+        not created again: the existing output net is returned. Operands of
+        commutative operators are keyed in a canonical order, so ``b + a``
+        shares the cell built for ``a + b``.
+        """
+        key = None
+        if self.share_subexpressions:
+            # The output width follows from these, so it is not part of the key
+            ids = [net.id for _, net in inputs]
+            if cell_op in _COMMUTATIVE_OPS and ids[0] > ids[1]:
+                ids.reverse()
+            key = (cell_op, *ids)
+            if attributes:
+                key += tuple(attributes.items())
+            shared = self._expr_cache.get(key)
+            if shared is not None:
+                return shared
+
+        cell = Cell(name=name, op=cell_op)
+        if attributes is not None:
+            cell.attributes = attributes
+        cell_inputs = cell.inputs
+        for pin_name, net in inputs:
+            pin = Pin(name=pin_name, direction=_INPUT, width=net.width, cell=cell, net=net)
+            cell_inputs[pin_name] = pin
+            net.sinks.append(pin)
+        y_pin = cell.add_output("Y", out_bw)
+
+        netlist = self.netlist
+        netlist.add_cell(cell)
+
+        out_net = Net(name=f"_{_CELLOP_LC[cell_op]}_{cell.id}", width=out_bw)
         out_net.set_driver(y_pin)
-        self.netlist.add_net(out_net)
+        netlist.add_net(out_net)
 
+        if key is not None:
+            self._expr_cache[key] = out_net
+            self._expr_keys[out_net.id] = key
         return out_net
 
     def _elaborate_unary_op(self, expr: UnaryOp) -> Net:
         """Elaborate a unary operation."""
-        op_map = {
-            "~": CellOp.NOT,
-            "!": CellOp.NOT,  # Logical NOT - same as bitwise for single bit
-            "-": CellOp.NEG,
-            "&": CellOp.REDUCE_AND,
-            "|": CellOp.REDUCE_OR,
-            "^": CellOp.REDUCE_XOR,
-        }
-
-        if expr.op not in op_map:
+        cell_op = _UNOP_CELLOP.get(expr.op)
+        if cell_op is None:
             raise ElaborationError(f"Unsupported unary operator: {expr.op}")
 
-        cell_op = op_map[expr.op]
+        # Fold operations on constant operands
+        if self.fold_constants:
+            operand = self._try_const_fold(expr.operand)
+            if operand is not None:
+                return self._elaborate_const(_fold_unary(cell_op, operand))
 
         # Elaborate operand
         operand_net = self._elaborate_expr(expr.operand)
 
-        # Create cell
-        cell = Cell(name=f"{cell_op.name.lower()}_{operand_net.name}", op=cell_op)
-
         # Determine output width
-        if cell_op in (CellOp.REDUCE_AND, CellOp.REDUCE_OR, CellOp.REDUCE_XOR):
-            out_width = 1
+        if cell_op in _REDUCE_OPS:
+            out_bw = _BW1
         else:
-            out_width = operand_net.width.width
+            out_bw = _bitwidth(operand_net.width.width)
 
-        # Add pins
-        a_pin = cell.add_input("A", operand_net.width)
-        y_pin = cell.add_output("Y", BitWidth.from_width(out_width))
-
-        # Connect input
-        operand_net.add_sink(a_pin)
-
-        self.netlist.add_cell(cell)
-
-        # Create output net
-        out_net = Net(name=f"_{cell.op.name.lower()}_{cell.id}", width=BitWidth.from_width(out_width))
-        out_net.set_driver(y_pin)
-        self.netlist.add_net(out_net)
-
-        return out_net
+        return self._emit(cell_op, f"{_CELLOP_LC[cell_op]}_{operand_net.name}",
+                          (("A", operand_net),), out_bw)
 
     def _elaborate_ternary_op(self, expr: TernaryOp) -> Net:
-        """Elaborate a ternary (conditional) operation as a MUX."""
-        # Elaborate condition and operands
-        cond_net = self._elaborate_expr(expr.cond)
-        true_net = self._elaborate_expr(expr.true_val)
-        false_net = self._elaborate_expr(expr.false_val)
-
-        # Create MUX cell: out = sel ? true : false
-        cell = Cell(name=f"mux_{cond_net.name}", op=CellOp.MUX)
-
-        # MUX(sel, false, true) - note the order!
-        sel_pin = cell.add_input("S", cond_net.width)
-        a_pin = cell.add_input("A", false_net.width)
-        b_pin = cell.add_input("B", true_net.width)
-
-        out_width = max(true_net.width.width, false_net.width.width)
-        y_pin = cell.add_output("Y", BitWidth.from_width(out_width))
-
-        # Connect
-        cond_net.add_sink(sel_pin)
-        false_net.add_sink(a_pin)
-        true_net.add_sink(b_pin)
+        """
+        Elaborate a ternary (conditional) operation as a MUX.
 
-        self.netlist.add_cell(cell)
+        Else-if style chains (a ? x : b ? y : z) nest down the false value;
+        like BinaryOp chains, they are elaborated with a loop.
 
-        # Create output net
-        out_net = Net(name=f"_mux_{cell.id}", width=BitWidth.from_width(out_width))
-        out_net.set_driver(y_pin)
-        self.netlist.add_net(out_net)
+        No MUX is built where it could only pass one input through: with
+        fold_constants a constant condition selects its branch directly,
+        and a level whose branches elaborate to the same net is that net.
+        If that net is a port or declared signal, it is passed through a
+        BUF: assignments take over the driver of the net they are given,
+        which must not be a signal's own.
+        """
+        elaborate_expr = self._elaborate_expr
+        levels = []
+        fold = self.fold_constants
+        node = expr
+        while True:
+            cond_lit = self._try_const_fold(node.cond) if fold else None
+            if cond_lit is not None:
+                # A conditional on constants only selects one of them
+                folded = self._try_const_fold(node)
+                if folded is not None:
+                    node = folded
+                    break
+                if cond_lit.value:
+                    node = node.true_val
+                    break
+            else:
+                # Elaborate condition and true value
+                levels.append((elaborate_expr(node.cond), elaborate_expr(node.true_val)))
+            node = node.false_val
+            if node.__class__ is not TernaryOp:
+                break
 
-        return out_net
+        # MUX(sel, false, true) - note the order!
+        emit = self._emit
+        mux = CellOp.MUX
+        net = elaborate_expr(node)
+        for cond_net, true_net in reversed(levels):
+            if true_net is net:
+                continue  # Both branches are the same signal
+            tw, fw = true_net.width.width, net.width.width
+            net = emit(mux, f"mux_{cond_net.name}", (("S", cond_net), ("A", net), ("B", true_net)),
+                       _bitwidth(tw if tw >= fw else fw))
+        if self.net_map.get(net.name) is net:
+            net = emit(CellOp.BUF, f"buf_{net.name}", (("A", net),), _bitwidth(net.width.width))
+        return net
 
     def _elaborate_concat(self, expr: Concat) -> Net:
         """Elaborate concatenation {a, b, c}."""
         # Elaborate all parts
-        part_nets = [self._elaborate_expr(part) for part in expr.parts]
-
-        # Create CONCAT cell
-        cell = Cell(name=f"concat_{len(part_nets)}", op=CellOp.CONCAT)
-
-        # Add input pins for each part
-        total_width = 0
-        for i, pnet in enumerate(part_nets):
-            pin = cell.add_input(f"A{i}", pnet.width)
-            pnet.add_sink(pin)
-            total_width += pnet.width.width
-
-        # Add output
-        y_pin = cell.add_output("Y", BitWidth.from_width(total_width))
-
-        self.netlist.add_cell(cell)
-
-        # Create output net
-        out_net = Net(name=f"_concat_{cell.id}", width=BitWidth.from_width(total_width))
-        out_net.set_driver(y_pin)
-        self.netlist.add_net(out_net)
+        elaborate_expr = self._elaborate_expr
+        part_nets = [elaborate_expr(part) for part in expr.parts]
 
-        return out_net
+        out_bw = _bitwidth(sum([pnet.width.width for pnet in part_nets]))
+        return self._emit(CellOp.CONCAT, f"concat_{len(part_nets)}",
+                          tuple((f"A{i}", pnet) for i, pnet in enumerate(part_nets)), out_bw)
 
     def _elaborate_bit_select(self, expr: BitSelect) -> Net:
         """Elaborate bit select, part select, or memory access."""
@@ -711,9 +1215,6 @@ class Elaborator:
         # Elaborate target
         target_net = self._elaborate_expr(expr.target)
 
-        # Create SLICE cell
-        cell = Cell(name=f"slice_{target_net.name}", op=CellOp.SLICE)
-
         # Evaluate bit indices
         msb = self._eval_const_expr(expr.msb)
         if expr.lsb is not None:
@@ -721,28 +1222,9 @@ class Elaborator:
         else:
             lsb = msb  # Single bit select
 
-        # Store slice range in attributes
-        cell.attributes["msb"] = msb
-        cell.attributes["lsb"] = lsb
-
-        # Determine output width
-        out_width = msb - lsb + 1
-
-        # Add pins
-        in_pin = cell.add_input("A", target_net.width)
-        out_pin = cell.add_output("Y", BitWidth.from_width(out_width))
-
-        # Connect
-        target_net.add_sink(in_pin)
-
-        self.netlist.add_cell(cell)
-
-        # Create output net
-        out_net = Net(name=f"_slice_{cell.id}", width=BitWidth.from_width(out_width))
-        out_net.set_driver(out_pin)
-        self.netlist.add_net(out_net)
-
-        return out_net
+        # SLICE cell; the range is stored in its attributes
+        return self._emit(CellOp.SLICE, f"slice_{target_net.name}", (("A", target_net),),
+                          _bitwidth(msb - lsb + 1), {"msb": msb, "lsb": lsb})
 
     def _elaborate_memory_read(self, mem_name: str, addr_expr: Expr) -> Net:
         """Elaborate a memory read: data = mem[addr]"""
@@ -753,8 +1235,8 @@ class Elaborator:
         addr_net = self._elaborate_expr(addr_expr)
 
         # Create MEMRD cell
-        next_id = len(self.netlist.cells)
-        cell = Cell(name=f"memrd_{mem_name}_{next_id}", op=CellOp.MEMRD)
+        self._mem_serial += 1
+        cell = Cell(name=f"memrd_{mem_name}_{self._mem_serial}", op=CellOp.MEMRD)
         cell.attributes["memory"] = mem_name
         cell.attributes["depth"] = depth
 
@@ -775,7 +1257,7 @@ class Elaborator:
         return out_net
 
     def _elaborate_memory_write(self, mem_name: str, addr_expr: Expr,
-                                  data_expr: Expr, clk_signal: str,
+                                  data_expr: Expr, clk_net: Optional[Net],
                                   enable_expr: Optional[Expr] = None):
         """Elaborate a memory write: mem[addr] <= data"""
         # Get memory info
@@ -786,13 +1268,13 @@ class Elaborator:
         data_net = self._elaborate_expr(data_expr)
 
         # Create MEMWR cell
-        next_id = len(self.netlist.cells)
-        cell = Cell(name=f"memwr_{mem_name}_{next_id}", op=CellOp.MEMWR)
+        self._mem_serial += 1
+        cell = Cell(name=f"memwr_{mem_name}_{self._mem_serial}", op=CellOp.MEMWR)
         cell.attributes["memory"] = mem_name
         cell.attributes["depth"] = depth
 
         # Add pins: clock, address, data, enable
-        clk_pin = cell.add_input("CLK", BitWidth(0, 0))
+        clk_pin = cell.add_input("CLK", _BW1)
         addr_pin = cell.add_input("ADDR", addr_net.width)
         data_pin = cell.add_input("DATA", data_width)
 
@@ -801,19 +1283,18 @@ class Elaborator:
         data_net.add_sink(data_pin)
 
         # Connect clock
-        if clk_signal in self.net_map:
-            clk_net = self.net_map[clk_signal]
+        if clk_net is not None:
             clk_net.add_sink(clk_pin)
 
         # Handle write enable
         if enable_expr:
             en_net = self._elaborate_expr(enable_expr)
-            en_pin = cell.add_input("EN", BitWidth(0, 0))
+            en_pin = cell.add_input("EN", _BW1)
             en_net.add_sink(en_pin)
         else:
             # Always enabled - create constant 1
-            const_one = self._elaborate_const(NumberLiteral(raw="1", value=1, width=1))
-            en_pin = cell.add_input("EN", BitWidth(0, 0))
+            const_one = self._elaborate_const(_LIT_ONE)
+            en_pin = cell.add_input("EN", _BW1)
             const_one.add_sink(en_pin)
 
         self.netlist.add_cell(cell)
@@ -821,7 +1302,7 @@ class Elaborator:
     def _get_width(self, range_node: Optional[Range]) -> BitWidth:
         """Extract bit width from a Range node."""
         if range_node is None:
-            return BitWidth(0, 0)  # Single bit
+            return _BW1  # Single bit
 
         msb = self._eval_const_expr(range_node.msb)
         lsb = self._eval_const_expr(range_node.lsb)
@@ -829,48 +1310,55 @@ class Elaborator:
 
     def _eval_const_expr(self, expr: Expr) -> int:
         """Evaluate a constant expression (for parameters, ranges)."""
-        if isinstance(expr, NumberLiteral):
-            return expr.value
-
-        elif isinstance(expr, Identifier):
-            # Look up parameter
-            if expr.name in self.parameters:
-                return self.parameters[expr.name]
-            raise ElaborationError(f"Undefined parameter: {expr.name}")
-
-        elif isinstance(expr, BinaryOp):
-            left = self._eval_const_expr(expr.left)
-            right = self._eval_const_expr(expr.right)
-
-            ops = {
-                "+": lambda a, b: a + b,
-                "-": lambda a, b: a - b,
-                "*": lambda a, b: a * b,
-                "/": lambda a, b: a // b,
-                "%": lambda a, b: a % b,
-                "&": lambda a, b: a & b,
-                "|": lambda a, b: a | b,
-                "^": lambda a, b: a ^ b,
-                "<<": lambda a, b: a << b,
-                ">>": lambda a, b: a >> b,
-            }
-
-            if expr.op in ops:
-                return ops[expr.op](left, right)
-
-        raise ElaborationError(f"Cannot evaluate non-constant expression: {type(expr).__name__}")
-
-
-def elaborate(ast: SourceFile, top_module: Optional[str] = None) -> Netlist:
+        handler = self._const_dispatch.get(expr.__class__)
+        if handler is None:
+            handler = self._resolve_handler(expr, self._CONST_HANDLERS, self._const_dispatch,
+                                            "Cannot evaluate non-constant expression")
+        return handler(self, expr)
+
+    def _eval_const_number(self, expr: NumberLiteral) -> int:
+        return expr.value
+
+    def _eval_const_identifier(self, expr: Identifier) -> int:
+        # Look up parameter
+        if expr.name in self.parameters:
+            return self.parameters[expr.name]
+        raise ElaborationError(f"Undefined parameter: {expr.name}")
+
+    def _eval_const_binary_op(self, expr: BinaryOp) -> int:
+        # Parameters are fixed once resolved, so results are memoized per
+        # node for the module being elaborated. The entry keeps the node
+        # alive, so its id cannot be reused by another node.
+        cached = self._const_eval_cache.get(id(expr))
+        if cached is not None:
+            return cached[1]
+
+        # The tree itself does not depend on the parameters: it is compiled
+        # once into closures, shared by every module and instance
+        compiled = self._const_fn_cache.get(id(expr))
+        if compiled is None:
+            compiled = (expr, _compile_const_expr(expr))
+            self._const_fn_cache[id(expr)] = compiled
+        value = compiled[1](self)
+
+        self._const_eval_cache[id(expr)] = (expr, value)
+        return value
+
+
+def elaborate(ast: SourceFile, top_module: Optional[str] = None,
+              fold_constants: bool = True, share_subexpressions: bool = True) -> Netlist:
     """
     Convenience function to elaborate an AST.
 
     Args:
         ast: Parsed Verilog source
         top_module: Name of top module to elaborate (defaults to first module)
+        fold_constants: Fold operators on literals into CONST cells
+        share_subexpressions: Build identical subexpressions only once
 
     Returns:
         Elaborated netlist
     """
-    elaborator = Elaborator()
+    elaborator = Elaborator(fold_constants=fold_constants,
+                            share_subexpressions=share_subexpressions)
     return elaborator.elaborate(ast, top_module)
@@ -8,9 +8,81 @@ Handles:
   - `define, `include, `ifdef (stripped as preprocessing — not yet expanded)
 """
 
+import re
+import sys
+
 from fpga_synth.hdl_parser.tokens import Token, TokenType, KEYWORDS
 
 
+# Operator text → token type. The master pattern tries the three- and
+# two-character operators before the single characters.
+_OPERATORS: dict[str, TokenType] = {
+    ">>>": TokenType.ARSHIFT,
+    "<<": TokenType.LSHIFT,
+    ">>": TokenType.RSHIFT,
+    "==": TokenType.EQ,
+    "!=": TokenType.NEQ,
+    "<=": TokenType.LE,
+    ">=": TokenType.GE,
+    "&&": TokenType.LAND,
+    "||": TokenType.LOR,
+    "->": TokenType.ARROW,
+    "+:": TokenType.PLUSCOLON,
+    "-:": TokenType.MINUSCOLON,
+    "+": TokenType.PLUS,
+    "-": TokenType.MINUS,
+    "*": TokenType.STAR,
+    "/": TokenType.SLASH,
+    "%": TokenType.PERCENT,
+    "&": TokenType.AMP,
+    "|": TokenType.PIPE,
+    "^": TokenType.CARET,
+    "~": TokenType.TILDE,
+    "!": TokenType.BANG,
+    "<": TokenType.LT,
+    ">": TokenType.GT,
+    "?": TokenType.QUESTION,
+    ":": TokenType.COLON,
+    "@": TokenType.AT,
+    "#": TokenType.HASH,
+    "(": TokenType.LPAREN,
+    ")": TokenType.RPAREN,
+    "[": TokenType.LBRACKET,
+    "]": TokenType.RBRACKET,
+    "{": TokenType.LBRACE,
+    "}": TokenType.RBRACE,
+    ";": TokenType.SEMICOLON,
+    ",": TokenType.COMMA,
+    ".": TokenType.DOT,
+    "=": TokenType.ASSIGN_OP,
+}
+
+# Operator text → (token type, canonical text). Operator tokens carry the
+# table's string as their value, so every "+" token shares one str object
+# instead of holding its own copy from the match.
+_OPERATOR_TOKENS: dict[str, tuple[TokenType, str]] = {
+    text: (tt, text) for text, tt in _OPERATORS.items()
+}
+
+# One pattern for every token kind, applied with match(source, pos): the
+# character loops run inside the regex engine, and m.lastgroup names the
+# kind. SKIP covers whitespace, // and /* */ comments (an unterminated one
+# runs to the end) and compiler directive lines.
+_MASTER_RE = re.compile(r"""
+    (?P<SKIP>(?:[ \t\r\n]+|//[^\n]*|/\*.*?(?:\*/|\Z)|`[^\n]*)+)
+  | (?P<IDENT>[A-Za-z_$][\w$]*)
+  | (?P<NUMBER>\d[\d_]*(?:'(?:[bhdoBHDO][0-9a-fA-FxXzZ_]*)?|(?:\.[\d_]*)?(?:[eE][+-]?[\d_]*)?)
+              |'[bhdoBHDO][0-9a-fA-FxXzZ_]*)
+  | (?P<ATTR>\(\*|\*\))
+  | (?P<OP>>>>|<<|>>|==|!=|<=|>=|&&|\|\||->|\+:|-:|[-+*/%&|^~!<>?:@\#()\[\]{};,.=])
+  | (?P<STRING>"(?P<BODY>(?:\\.|[^"\\])*)"?)
+""", re.DOTALL | re.VERBOSE)
+
+# Identifiers that start with a non-ASCII letter (\w: str.isalnum() and "_")
+_IDENT_BODY_RE = re.compile(r"[\w$]*")
+_ESCAPE_RE = re.compile(r"\\(.)", re.DOTALL)
+
+
 class LexerError(Exception):
     def __init__(self, msg: str, line: int, col: int):
         super().__init__(f"Lexer error at L{line}:{col}: {msg}")
@@ -27,243 +99,94 @@ class Lexer:
         self.col = 1
         self.tokens: list[Token] = []
         self.in_attribute = False  # Track if we're inside an attribute
-    
-    def _peek(self, offset=0) -> str:
-        p = self.pos + offset
-        if p < len(self.source):
-            return self.source[p]
-        return "\0"
-    
-    def _advance(self) -> str:
-        ch = self.source[self.pos]
-        self.pos += 1
-        if ch == "\n":
-            self.line += 1
-            self.col = 1
-        else:
-            self.col += 1
-        return ch
-    
-    def _at_end(self) -> bool:
-        return self.pos >= len(self.source)
-    
-    def _skip_whitespace_and_comments(self):
-        while not self._at_end():
-            ch = self._peek()
-            
-            # Whitespace
-            if ch in " \t\r\n":
-                self._advance()
-                continue
-            
-            # Line comment
-            if ch == "/" and self._peek(1) == "/":
-                while not self._at_end() and self._peek() != "\n":
-                    self._advance()
-                continue
-            
-            # Block comment
-            if ch == "/" and self._peek(1) == "*":
-                self._advance()  # /
-                self._advance()  # *
-                while not self._at_end():
-                    if self._peek() == "*" and self._peek(1) == "/":
-                        self._advance()  # *
-                        self._advance()  # /
-                        break
-                    self._advance()
-                continue
-            
-            # Compiler directives (skip the line)
-            if ch == "`":
-                while not self._at_end() and self._peek() != "\n":
-                    self._advance()
-                continue
-            
-            break
-    
-    def _read_number(self) -> Token:
-        """Read a Verilog number literal.
-
-        Formats: 123, 8'hFF, 4'b1010, 3'd7, 'h1A, 'b1, 1.5, 2.5e10, 1.0e-3
-        """
-        start_line, start_col = self.line, self.col
-        num_str = ""
-
-        # Read the size prefix or plain number
-        while not self._at_end() and (self._peek().isdigit() or self._peek() == "_"):
-            num_str += self._advance()
-
-        # Check for sized literal: <size>'<base><digits>
-        if not self._at_end() and self._peek() == "'":
-            num_str += self._advance()  # consume '
-            if not self._at_end() and self._peek().lower() in "bhdo":
-                num_str += self._advance()  # consume base char
-                # Read hex/bin/oct/dec digits
-                while not self._at_end() and (
-                    self._peek() in "0123456789abcdefABCDEFxXzZ_"
-                ):
-                    num_str += self._advance()
-            return Token(TokenType.NUMBER, num_str, start_line, start_col)
-
-        # Check for real number: decimal point
-        if not self._at_end() and self._peek() == ".":
-            num_str += self._advance()  # consume .
-            # Read fractional part
-            while not self._at_end() and (self._peek().isdigit() or self._peek() == "_"):
-                num_str += self._advance()
-
-        # Check for scientific notation: e or E
-        if not self._at_end() and self._peek().lower() == "e":
-            num_str += self._advance()  # consume e/E
-            # Optional +/- sign
-            if not self._at_end() and self._peek() in "+-":
-                num_str += self._advance()
-            # Read exponent
-            while not self._at_end() and (self._peek().isdigit() or self._peek() == "_"):
-                num_str += self._advance()
 
-        return Token(TokenType.NUMBER, num_str, start_line, start_col)
-    
-    def _read_ident_or_keyword(self) -> Token:
-        start_line, start_col = self.line, self.col
-        ident = ""
-        while not self._at_end() and (self._peek().isalnum() or self._peek() in "_$"):
-            ident += self._advance()
-        
-        tt = KEYWORDS.get(ident, TokenType.IDENT)
-        return Token(tt, ident, start_line, start_col)
-    
-    def _make_token(self, tt: TokenType, value: str) -> Token:
-        return Token(tt, value, self.line, self.col)
-    
     def tokenize(self) -> list[Token]:
         """Tokenize the entire source. Returns list of tokens ending with EOF."""
-        self.tokens = []
-        
-        while True:
-            self._skip_whitespace_and_comments()
-            if self._at_end():
-                break
-            
-            ch = self._peek()
-            start_line, start_col = self.line, self.col
-            
-            # Numbers (also handle unsized literals like 'h1A)
-            if ch.isdigit():
-                self.tokens.append(self._read_number())
-                continue
-            
-            if ch == "'" and self._peek(1).lower() in "bhdo":
-                self.tokens.append(self._read_number())
-                continue
-            
-            # Identifiers and keywords
-            if ch.isalpha() or ch == "_" or ch == "$":
-                self.tokens.append(self._read_ident_or_keyword())
-                continue
-            
-            # String literals
-            if ch == '"':
-                self._advance()  # opening "
-                s = ""
-                while not self._at_end() and self._peek() != '"':
-                    if self._peek() == "\\":
-                        self._advance()
-                        s += self._advance()
-                    else:
-                        s += self._advance()
-                if not self._at_end():
-                    self._advance()  # closing "
-                self.tokens.append(Token(TokenType.STRING, s, start_line, start_col))
-                continue
-            
-            # Multi-character operators
-            ch2 = ch + self._peek(1) if self.pos + 1 < len(self.source) else ch
-            ch3 = ch2 + self._peek(2) if self.pos + 2 < len(self.source) else ch2
-
-            # Attribute begin: (* but NOT (*)
-            # @(*) is sensitivity list, not an attribute
-            ch3_check = ""
-            if self.pos + 2 < len(self.source):
-                ch3_check = ch2 + self.source[self.pos + 2]
-
-            if ch2 == "(*" and ch3_check != "(*)":
-                self._advance(); self._advance()
-                self.tokens.append(Token(TokenType.ATTR_BEGIN, "(*", start_line, start_col))
-                self.in_attribute = True
-                continue
-
-            # Attribute end: *) - only if we're inside an attribute
-            if ch2 == "*)" and self.in_attribute:
-                self._advance(); self._advance()
-                self.tokens.append(Token(TokenType.ATTR_END, "*)", start_line, start_col))
-                self.in_attribute = False
-                continue
-
-            if ch3 == ">>>":
-                self._advance(); self._advance(); self._advance()
-                self.tokens.append(Token(TokenType.ARSHIFT, ">>>", start_line, start_col))
-                continue
-
-            TWO_CHAR = {
-                "<<": TokenType.LSHIFT,
-                ">>": TokenType.RSHIFT,
-                "==": TokenType.EQ,
-                "!=": TokenType.NEQ,
-                "<=": TokenType.LE,
-                ">=": TokenType.GE,
-                "&&": TokenType.LAND,
-                "||": TokenType.LOR,
-                "->": TokenType.ARROW,
-                "+:": TokenType.PLUSCOLON,
-                "-:": TokenType.MINUSCOLON,
-            }
-
-            if ch2 in TWO_CHAR:
-                self._advance(); self._advance()
-                self.tokens.append(Token(TWO_CHAR[ch2], ch2, start_line, start_col))
-                continue
-            
-            # Single character operators/delimiters
-            ONE_CHAR = {
-                "+": TokenType.PLUS,
-                "-": TokenType.MINUS,
-                "*": TokenType.STAR,
-                "/": TokenType.SLASH,
-                "%": TokenType.PERCENT,
-                "&": TokenType.AMP,
-                "|": TokenType.PIPE,
-                "^": TokenType.CARET,
-                "~": TokenType.TILDE,
-                "!": TokenType.BANG,
-                "<": TokenType.LT,
-                ">": TokenType.GT,
-                "?": TokenType.QUESTION,
-                ":": TokenType.COLON,
-                "@": TokenType.AT,
-                "#": TokenType.HASH,
-                "(": TokenType.LPAREN,
-                ")": TokenType.RPAREN,
-                "[": TokenType.LBRACKET,
-                "]": TokenType.RBRACKET,
-                "{": TokenType.LBRACE,
-                "}": TokenType.RBRACE,
-                ";": TokenType.SEMICOLON,
-                ",": TokenType.COMMA,
-                ".": TokenType.DOT,
-                "=": TokenType.ASSIGN_OP,
-            }
-            
-            if ch in ONE_CHAR:
-                self._advance()
-                self.tokens.append(Token(ONE_CHAR[ch], ch, start_line, start_col))
-                continue
-            
-            raise LexerError(f"Unexpected character: {ch!r}", self.line, self.col)
-        
-        self.tokens.append(Token(TokenType.EOF, "", self.line, self.col))
-        return self.tokens
+        src = self.source
+        end = len(src)
+        tokens = []
+        append = tokens.append
+        match = _MASTER_RE.match
+        operators = _OPERATOR_TOKENS
+        keywords = KEYWORDS
+        IDENT = TokenType.IDENT
+        NUMBER = TokenType.NUMBER
+        intern = sys.intern
+        in_attribute = self.in_attribute
+
+        pos = 0
+        line = 1
+        line_start = 0  # Offset of the first character of the current line
+        while pos < end:
+            m = match(src, pos)
+            if m is None:
+                ch = src[pos]
+                if not ch.isalpha():
+                    raise LexerError(f"Unexpected character: {ch!r}", line, pos - line_start + 1)
+                # Identifier starting with a non-ASCII letter
+                m = _IDENT_BODY_RE.match(src, pos)
+                kind = "IDENT"
+            else:
+                kind = m.lastgroup
+            text = m.group()
+            col = pos - line_start + 1
+
+            if kind == "SKIP":
+                pass
+
+            elif kind == "IDENT":
+                tt = keywords.get(text, IDENT)
+                if tt is IDENT:
+                    # Names are interned so the elaborator's signal-table
+                    # lookups compare them by identity
+                    text = intern(text)
+                append(Token(tt, text, line, col))
+
+            elif kind == "OP":
+                tt, text = operators[text]
+                append(Token(tt, text, line, col))
+
+            elif kind == "NUMBER":
+                append(Token(NUMBER, text, line, col))
+
+            elif kind == "ATTR":
+                # (* opens an attribute, but @(*) is a sensitivity list;
+                # *) only closes one inside an attribute. Otherwise only the
+                # first character is taken, as a plain operator.
+                if text == "(*" and not src.startswith(")", pos + 2):
+                    append(Token(TokenType.ATTR_BEGIN, text, line, col))
+                    in_attribute = True
+                elif text == "*)" and in_attribute:
+                    append(Token(TokenType.ATTR_END, text, line, col))
+                    in_attribute = False
+                else:
+                    tt, text = operators[text[0]]
+                    append(Token(tt, text, line, col))
+                    pos += 1
+                    continue
+
+            else:  # STRING; backslash escapes keep the escaped character
+                body = m.group("BODY")
+                if "\\" in body:
+                    body = _ESCAPE_RE.sub(r"\1", body)
+                append(Token(TokenType.STRING, body, line, col))
+
+            # Only skipped text and strings can span lines
+            new_pos = m.end()
+            if kind == "SKIP" or kind == "STRING":
+                newlines = src.count("\n", pos, new_pos)
+                if newlines:
+                    line += newlines
+                    line_start = src.rfind("\n", pos, new_pos) + 1
+            pos = new_pos
+
+        self.pos = pos
+        self.line = line
+        self.col = pos - line_start + 1
+        self.in_attribute = in_attribute
+        tokens.append(Token(TokenType.EOF, "", self.line, self.col))
+        self.tokens = tokens
+        return tokens
 
 
 def lex(source: str, filename: str = "<input>") -> list[Token]:
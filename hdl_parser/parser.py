@@ -161,9 +161,9 @@ class Parser:
 
     def _parse_attributes(self) -> dict[str, str]:
         """Parse Verilog attributes: (* key1 = value1, key2 = value2 *)"""
-        attrs = {}
         if not self._at(TokenType.ATTR_BEGIN):
-            return attrs
+            return EMPTY_ATTRIBUTES
+        attrs = {}
 
         self._eat(TokenType.ATTR_BEGIN)
 
@@ -668,7 +668,7 @@ class Parser:
         self._eat(TokenType.RPAREN)
         
         then_body = self._parse_statement_or_block()
-        else_body = []
+        else_body = EMPTY_STMTS
         
         if self._eat_if(TokenType.ELSE):
             else_body = self._parse_statement_or_block()
@@ -691,7 +691,7 @@ class Parser:
             if self._at(TokenType.DEFAULT):
                 self._eat(TokenType.DEFAULT)
                 self._eat(TokenType.COLON)
-                cs.default = self._parse_statement_or_block()
+                cs.default = self._parse_statement_or_block() or EMPTY_STMTS
             else:
                 ci = CaseItem(line=self._cur().line, col=self._cur().col)
                 # Parse comma-separated values
@@ -906,7 +906,7 @@ class Parser:
         self._eat(TokenType.RPAREN)
 
         then_body = self._parse_generate_item_or_block()
-        else_body = []
+        else_body = EMPTY_STMTS
 
         if self._eat_if(TokenType.ELSE):
             else_body = self._parse_generate_item_or_block()
@@ -958,7 +958,7 @@ class Parser:
             if self._at(TokenType.DEFAULT):
                 self._eat(TokenType.DEFAULT)
                 self._eat(TokenType.COLON)
-                cs.default = self._parse_generate_item_or_block()
+                cs.default = self._parse_generate_item_or_block() or EMPTY_STMTS
             else:
                 ci = CaseItem(line=self._cur().line, col=self._cur().col)
                 # Parse comma-separated values
@@ -17,8 +17,9 @@ Graph properties we maintain:
 from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Optional, Iterator
-from collections import defaultdict
+from collections import defaultdict, deque
 import itertools
+import sys
 
 from fpga_synth.ir.types import CellOp, BitWidth, PortDir
 
@@ -44,7 +45,7 @@ def reset_ids():
 # Pin — A connection point on a Cell
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class Pin:
     """A named connection point on a cell.
     
@@ -68,7 +69,7 @@ class Pin:
 # Net — A hyperedge connecting one driver to N sinks
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class Net:
     """A signal net — a hyperedge in the netlist graph.
     
@@ -109,7 +110,7 @@ class Net:
 # Cell — A node in the netlist DAG
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class Cell:
     """A logic cell — a node in the netlist graph.
     
@@ -201,7 +202,12 @@ class Netlist:
         return cell
     
     def add_net(self, net: Net) -> Net:
-        """Add a net to the netlist."""
+        """Add a net to the netlist.
+        
+        The net name is interned: the same names recur across the netlist,
+        its lookup maps and writer output, so they share one string object.
+        """
+        net.name = sys.intern(net.name)
         self.nets[net.id] = net
         return net
     
@@ -298,11 +304,23 @@ class Netlist:
         if cell.id in self.cells:
             del self.cells[cell.id]
         
-        # Remove from I/O dicts if present
-        self.inputs = {k: v for k, v in self.inputs.items() if v.id != cell.id}
-        self.outputs = {k: v for k, v in self.outputs.items() if v.id != cell.id}
+        # Remove from I/O dicts if present (only port cells are listed there)
+        if cell.op is CellOp.MODULE_INPUT:
+            self.inputs = {k: v for k, v in self.inputs.items() if v.id != cell.id}
+        elif cell.op is CellOp.MODULE_OUTPUT:
+            self.outputs = {k: v for k, v in self.outputs.items() if v.id != cell.id}
         self._topo_dirty = True
     
+    # ---- Iteration ----
+    
+    def cells_iter(self) -> Iterator[Cell]:
+        """Iterate over the cells, in insertion order."""
+        return iter(self.cells.values())
+    
+    def nets_iter(self) -> Iterator[Net]:
+        """Iterate over the nets, in insertion order."""
+        return iter(self.nets.values())
+    
     # ---- Graph Traversal ----
     
     def topological_sort(self) -> list[Cell]:
@@ -327,11 +345,11 @@ class Netlist:
                     in_degree[cell.id] += 1
         
         # Seed with zero in-degree cells
-        queue = [cid for cid, deg in in_degree.items() if deg == 0]
+        queue = deque(cid for cid, deg in in_degree.items() if deg == 0)
         order = []
         
         while queue:
-            cid = queue.pop(0)
+            cid = queue.popleft()
             cell = self.cells[cid]
             order.append(cell)
             
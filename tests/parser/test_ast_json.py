@@ -13,7 +13,8 @@ from fpga_synth.hdl_parser.parser import parse_verilog
 from fpga_synth.hdl_parser.ast_nodes import *
 from fpga_synth.hdl_parser.ast_json import (
     ast_to_dict, ast_to_json, dict_to_ast, json_to_ast,
-    ast_to_json_file, ast_from_json_file, ast_to_compact_json
+    ast_to_json_file, ast_from_json_file, ast_to_compact_json,
+    CompactJSONEncoder
 )
 
 
@@ -225,6 +226,164 @@ def test_compact_json():
     print("✓ test_compact_json")
 
 
+def test_compact_encoder_simple_dict():
+    """Test: Short flat dicts are emitted on one line"""
+    encoder = CompactJSONEncoder(indent=2)
+    simple = {"_type": "Identifier", "name": "a", "line": 1, "col": 2}
+    assert encoder.encode(simple) == json.dumps(simple, separators=(',', ':'))
+
+    long_name = {"_type": "Identifier", "name": "x" * 120}
+    assert "\n" in encoder.encode(long_name)
+    print("✓ test_compact_encoder_simple_dict")
+
+
+def test_unknown_node_type():
+    """Test: Only AST node classes can be reconstructed"""
+    for bad in ({"_type": "NotANode"}, {"_type": "Optional"}, {"name": "x"}):
+        try:
+            dict_to_ast(bad)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"expected ValueError for {bad}")
+    print("✓ test_unknown_node_type")
+
+
+def test_unknown_field():
+    """Test: Fields not declared on the node class are rejected"""
+    try:
+        dict_to_ast({"_type": "Identifier", "name": "a", "bogus": 1})
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("expected ValueError for unknown field")
+
+    # Nodes are slotted, so stray attributes cannot be attached either
+    assert not hasattr(Identifier(), "__dict__")
+    print("✓ test_unknown_field")
+
+
+def test_dict_to_ast_deep_nesting():
+    """Test: Very deep expression chains load without recursion errors"""
+    depth = sys.getrecursionlimit() * 2
+    data = {"_type": "Identifier", "name": "x0"}
+    for i in range(1, depth):
+        data = {"_type": "BinaryOp", "op": "+", "left": data,
+                "right": {"_type": "Identifier", "name": f"x{i}"}}
+
+    node = dict_to_ast(data)
+    count = 0
+    while isinstance(node, BinaryOp):
+        assert node.right.name == f"x{depth - 1 - count}"
+        node = node.left
+        count += 1
+    assert count == depth - 1
+    assert node.name == "x0"
+    print("✓ test_dict_to_ast_deep_nesting")
+
+
+def test_ast_to_dict_user_subclass():
+    """Test: Node classes defined outside ast_nodes are encoded too"""
+    from dataclasses import dataclass
+
+    @dataclass(slots=True)
+    class TaggedExpr(Expr):
+        tag: str = ""
+        inner: Expr = None
+
+    node = TaggedExpr(line=3, tag="t", inner=Identifier(name="a"))
+    assert ast_to_dict(node) == {
+        "_type": "TaggedExpr", "line": 3, "col": 0, "tag": "t",
+        "inner": {"_type": "Identifier", "line": 0, "col": 0, "name": "a"},
+    }
+    print("✓ test_ast_to_dict_user_subclass")
+
+
+def test_json_import_order():
+    """Test: json_to_ast builds ast_nodes classes when ast_json is imported first"""
+    import subprocess
+    code = (
+        "from fpga_synth.hdl_parser.ast_json import ast_to_json, json_to_ast\n"
+        "from fpga_synth.hdl_parser.ast_nodes import Module\n"
+        "from fpga_synth.hdl_parser.parser import parse_verilog\n"
+        "ast = parse_verilog('module m; wire w; endmodule')\n"
+        "ast2 = json_to_ast(ast_to_json(ast))\n"
+        "assert type(ast2.modules[0]) is Module\n"
+        "assert ast2 == ast\n"
+    )
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([project_root, os.environ.get("PYTHONPATH", "")]))
+    result = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    print("✓ test_json_import_order")
+
+
+def test_node_class_table():
+    """Test: Every node class name resolves to the class ast_nodes exports"""
+    from fpga_synth.hdl_parser import ast_nodes
+    from fpga_synth.hdl_parser.ast_json import _NODE_CLASSES
+    names = [name for name, obj in vars(ast_nodes).items()
+             if isinstance(obj, type) and issubclass(obj, ASTNode)]
+    assert "Module" in names and "TimeDecl" in names
+    for name in names:
+        assert _NODE_CLASSES[name] is getattr(ast_nodes, name), name
+    print("✓ test_node_class_table")
+
+
+def test_wide_literal_round_trip():
+    """Test: Literals wider than 64 bits survive JSON round trip"""
+    verilog = """
+    module test(output [127:0] y);
+        assign y = 128'hFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF;
+    endmodule
+    """
+    ast = parse_verilog(verilog)
+
+    json_str = ast_to_json(ast)
+    ast2 = json_to_ast(json_str)
+
+    assign = ast2.modules[0].body[0]
+    assert assign.rhs.value == (1 << 128) - 1
+    assert isinstance(assign.rhs.value, int)
+
+    with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
+        path = f.name
+    try:
+        ast_to_json_file(ast, path)
+        ast3 = ast_from_json_file(path)
+        assert ast3.modules[0].body[0].rhs.value == (1 << 128) - 1
+    finally:
+        os.unlink(path)
+
+    print("✓ test_wide_literal_round_trip")
+
+
+def test_json_format_without_orjson():
+    """Test: The stdlib fallback writes the same JSON as orjson"""
+    verilog = """
+    module test(input café, output y);
+        (* note = "µ-arch" *) wire w;
+        assign y = café;
+    endmodule
+    """
+    ast = parse_verilog(verilog)
+    from fpga_synth.hdl_parser import ast_json
+    outputs = []
+    saved = ast_json.orjson
+    for backend in (saved, None):
+        ast_json.orjson = backend
+        try:
+            outputs.append((ast_to_json(ast, indent=None), ast_to_json(ast, indent=2)))
+        finally:
+            ast_json.orjson = saved
+    assert outputs[0] == outputs[1]
+
+    compact, indented = outputs[1]
+    assert compact.startswith('{"_type":"SourceFile","line":0,')
+    assert "café" in compact and "µ-arch" in indented
+    assert json_to_ast(compact) == ast
+    print("✓ test_json_format_without_orjson")
+
+
 def test_integration_uart_to_json():
     """Test: Convert UART design to JSON"""
     uart_path = os.path.join(os.path.dirname(__file__), "..", "integration", "uart_tx.v")
@@ -270,6 +429,15 @@ def run_all():
         test_module_with_parameters,
         test_nested_expressions,
         test_compact_json,
+        test_compact_encoder_simple_dict,
+        test_unknown_node_type,
+        test_unknown_field,
+        test_dict_to_ast_deep_nesting,
+        test_ast_to_dict_user_subclass,
+        test_json_import_order,
+        test_node_class_table,
+        test_wide_literal_round_trip,
+        test_json_format_without_orjson,
         test_integration_uart_to_json,
     ]
 
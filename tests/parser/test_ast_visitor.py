@@ -12,7 +12,7 @@ from fpga_synth.hdl_parser.ast_nodes import *
 from fpga_synth.hdl_parser.ast_visitor import (
     ASTVisitor, ASTTransformer, ASTDumper,
     ModuleCollector, IdentifierCollector,
-    StatisticsVisitor, AlwaysBlockCollector
+    StatisticsVisitor, AlwaysBlockCollector, walk
 )
 
 
@@ -242,6 +242,186 @@ def test_visitor_with_complex_design():
     print(f"✓ test_visitor_with_complex_design ({stats.total_nodes} nodes, {len(id_collector.identifiers)} identifiers)")
 
 
+def test_visit_order_follows_field_declaration():
+    """Test: generic_visit walks fields in declaration order"""
+    verilog = """
+    module test #(parameter W = 8) (input [W-1:0] a, output [W-1:0] y);
+        assign y = a;
+    endmodule
+    """
+    ast = parse_verilog(verilog)
+
+    class OrderRecorder(ASTVisitor):
+        def __init__(self):
+            self.order = []
+
+        def generic_visit(self, node):
+            self.order.append(type(node).__name__)
+            return super().generic_visit(node)
+
+    recorder = OrderRecorder()
+    recorder.visit(ast.modules[0])
+    order = recorder.order
+    # Module fields: params, ports, body
+    assert order.index("ParamDecl") < order.index("PortDecl") < order.index("ContinuousAssign")
+    print("✓ test_visit_order_follows_field_declaration")
+
+
+def test_walk_matches_recursive_visit():
+    """Test: walk() yields the same pre-order as recursive dispatch"""
+    verilog = """
+    module test(input clk, input [7:0] a, input [7:0] b, output reg [7:0] y);
+        always @(posedge clk) begin
+            if (a > b)
+                y <= a - b;
+            else
+                y <= {a[3:0], b[3:0]};
+        end
+    endmodule
+    """
+    ast = parse_verilog(verilog)
+
+    class Recorder(ASTVisitor):
+        def __init__(self):
+            self.nodes = []
+
+        def generic_visit(self, node):
+            self.nodes.append(node)
+            return super().generic_visit(node)
+
+    recorder = Recorder()
+    recorder.visit(ast)
+    walked = list(walk(ast))
+    assert len(walked) == len(recorder.nodes)
+    assert all(a is b for a, b in zip(walked, recorder.nodes))
+
+    stats = StatisticsVisitor()
+    stats.visit(ast)
+    assert stats.total_nodes == len(recorder.nodes)
+    print("✓ test_walk_matches_recursive_visit")
+
+
+def test_collector_subclass_overrides():
+    """Test: Collector subclasses that override visit methods still dispatch to them"""
+    ast = parse_verilog("""
+    module top(input a, output y);
+        assign y = a;
+    endmodule
+    module leaf(input b);
+    endmodule
+    """)
+
+    class TopOnly(ModuleCollector):
+        def visit_Module(self, node):
+            if node.name == "top":
+                self.modules.append(node)
+
+    class Renamed(IdentifierCollector):
+        def visit_Identifier(self, node):
+            self.identifiers.add(node.name.upper())
+
+    class SkipModules(StatisticsVisitor):
+        def visit_Module(self, node):
+            return None
+
+    collector = TopOnly()
+    collector.visit(ast)
+    assert [m.name for m in collector.modules] == ["top"]
+
+    renamed = Renamed()
+    renamed.visit(ast)
+    assert renamed.identifiers == {"Y", "A"}
+
+    stats = SkipModules()
+    stats.visit(ast)
+    assert stats.node_counts == {"SourceFile": 1}
+
+    # Plain collectors keep the fast path
+    assert ModuleCollector._fast_walk and not TopOnly._fast_walk
+    print("✓ test_collector_subclass_overrides")
+
+
+def test_dispatch_cache_per_visitor_class():
+    """Test: cached visit_* resolution does not leak between visitor classes"""
+    ast = parse_verilog("""
+    module test(input a, output y);
+        assign y = a;
+    endmodule
+    """)
+
+    class Upper(ASTVisitor):
+        def __init__(self):
+            self.names = []
+
+        def visit_Identifier(self, node):
+            self.names.append(node.name.upper())
+
+    class Plain(ASTVisitor):
+        def __init__(self):
+            self.names = []
+
+        def visit_Identifier(self, node):
+            self.names.append(node.name)
+
+    class Silent(Plain):
+        def visit_Identifier(self, node):
+            pass
+
+    for _ in range(2):
+        upper, plain, silent = Upper(), Plain(), Silent()
+        upper.visit(ast)
+        plain.visit(ast)
+        silent.visit(ast)
+        assert upper.names == ["Y", "A"]
+        assert plain.names == ["y", "a"]
+        assert silent.names == []
+    print("✓ test_dispatch_cache_per_visitor_class")
+
+
+def test_child_field_plan():
+    """Test: only node-typed fields are part of the traversal plan"""
+    assert node_child_fields(IfStatement) == (
+        ("cond", False), ("then_body", True), ("else_body", True))
+    assert node_child_fields(NetDecl) == (
+        ("range", False), ("array_dims", True), ("init_value", False))
+    assert node_child_fields(Identifier) == ()
+
+    # Transformers leave the shared empty defaults alone
+    ast = parse_verilog("""
+    module test(input a, output reg y);
+        always @(*) if (a) y = 1'b1;
+    endmodule
+    """)
+    ASTTransformer().visit(ast)
+    if_stmt = ast.modules[0].body[0].body[0]
+    assert if_stmt.else_body is EMPTY_STMTS
+    print("✓ test_child_field_plan")
+
+
+def test_transformer_keeps_unchanged_lists():
+    """Test: lists are only replaced when an item actually changed"""
+    ast = parse_verilog("""
+    module test(input a, input b, output y, output z);
+        assign y = a;
+        assign z = b;
+    endmodule
+    """)
+    mod = ast.modules[0]
+    body = mod.body
+
+    ASTTransformer().visit(ast)
+    assert mod.body is body
+
+    class DropZ(ASTTransformer):
+        def visit_ContinuousAssign(self, node):
+            return None if node.lhs.name == "z" else node
+
+    DropZ().visit(ast)
+    assert mod.body is not body
+    assert [item.lhs.name for item in mod.body] == ["y"]
+    print("✓ test_transformer_keeps_unchanged_lists")
+
+
 def run_all():
     """Run all AST visitor tests"""
     tests = [
@@ -253,6 +433,12 @@ def run_all():
         test_always_block_collector,
         test_transformer_rename,
         test_visitor_with_complex_design,
+        test_visit_order_follows_field_declaration,
+        test_walk_matches_recursive_visit,
+        test_collector_subclass_overrides,
+        test_dispatch_cache_per_visitor_class,
+        test_child_field_plan,
+        test_transformer_keeps_unchanged_lists,
     ]
 
     passed = 0
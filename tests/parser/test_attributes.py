@@ -162,6 +162,41 @@ def test_attribute_without_value():
     print("✓ test_attribute_without_value")
 
 
+def test_nodes_without_attributes_share_empty_dict():
+    """Test: unattributed nodes share one read-only empty dict"""
+    import copy
+    verilog = """
+    module test;
+        wire a;
+        (* keep *) wire b;
+    endmodule
+    """
+    ast = parse_verilog(verilog)
+    mod = ast.modules[0]
+    a, b = mod.body
+
+    assert a.attributes is EMPTY_ATTRIBUTES
+    assert mod.attributes is EMPTY_ATTRIBUTES
+    assert Identifier(name="x").attributes is EMPTY_ATTRIBUTES
+    assert b.attributes == {"keep": ""}
+
+    try:
+        a.attributes["keep"] = "true"
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("shared empty attributes must be read-only")
+
+    set_attribute(a, "keep", "true")
+    assert a.attributes == {"keep": "true"}
+    assert EMPTY_ATTRIBUTES == {}
+
+    clone = copy.deepcopy(mod)
+    assert clone.attributes is EMPTY_ATTRIBUTES
+    assert clone.body[0].attributes == {"keep": "true"}
+    print("✓ test_nodes_without_attributes_share_empty_dict")
+
+
 def run_all():
     """Run all attribute tests"""
     tests = [
@@ -173,6 +208,7 @@ def run_all():
         test_attribute_with_number,
         test_attribute_on_parameter,
         test_attribute_without_value,
+        test_nodes_without_attributes_share_empty_dict,
     ]
 
     passed = 0
@@ -8,7 +8,8 @@ project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(o
 sys.path.insert(0, project_root)
 
 from fpga_synth.hdl_parser.parser import parse_verilog
-from fpga_synth.hdl_parser.codegen import generate_verilog
+from fpga_synth.hdl_parser.ast_nodes import ASTNode, Block, UnaryOp
+from fpga_synth.hdl_parser.codegen import generate_verilog, VerilogCodeGenerator
 
 
 def test_simple_module():
@@ -233,6 +234,196 @@ endmodule"""
     print("✓ test_system_task")
 
 
+def test_dispatch_per_generator_class():
+    """Test: Subclass overrides are dispatched; unknown nodes still raise"""
+    class UpperIdents(VerilogCodeGenerator):
+        def _gen_Identifier(self, node):
+            self._write(node.name.upper())
+
+    ast = parse_verilog("""module test;
+    assign y = a;
+endmodule""")
+
+    assert "assign Y = A;" in UpperIdents().generate(ast)
+    assert "assign y = a;" in generate_verilog(ast)
+    assert "assign Y = A;" in UpperIdents().generate(ast)
+
+    class Unknown(ASTNode):
+        pass
+
+    try:
+        generate_verilog(Unknown())
+        assert False, "Expected NotImplementedError"
+    except NotImplementedError as e:
+        assert "Unknown" in str(e)
+    print("✓ test_dispatch_per_generator_class")
+
+
+def test_long_operator_chains():
+    """Test: Long left-associative and ternary chains generate without recursion"""
+    terms = " + ".join(f"a{i}" for i in range(1500))
+    ast = parse_verilog(f"module test; assign y = {terms}; endmodule")
+    generated = generate_verilog(ast)
+    assert "(" * 1499 + "a0 + a1) + a2)" in generated
+    assert generated.count(")") == 1499
+
+    ast = parse_verilog("module test; assign y = s0 ? a : s1 ? b : c; endmodule")
+    generated = generate_verilog(ast)
+    assert "assign y = (s0 ? a : (s1 ? b : c));" in generated
+    print("✓ test_long_operator_chains")
+
+
+def test_indent_str_change_between_runs():
+    """Test: A generator picks up a new indent_str on the next generate()"""
+    ast = parse_verilog("""module test;
+    initial begin
+        $display("x");
+    end
+endmodule""")
+
+    gen = VerilogCodeGenerator()
+    assert "\n        $display" in gen.generate(ast)
+    gen.indent_str = "\t"
+    generated = gen.generate(ast)
+    assert "\n\t\t$display" in generated
+    assert "    " not in generated
+    print("✓ test_indent_str_change_between_runs")
+
+
+def test_module_cache():
+    """Test: A shared module cache reuses module text without changing output"""
+    ast = parse_verilog("""module a(input x, output y);
+    assign y = ~x;
+endmodule
+module b;
+    wire w;
+endmodule""")
+
+    expected = generate_verilog(ast)
+    cache = {}
+    assert generate_verilog(ast, module_cache=cache) == expected
+    assert len(cache) == 2
+    assert generate_verilog(ast, module_cache=cache) == expected
+
+    tabbed = generate_verilog(ast, indent_str="\t", module_cache=cache)
+    assert tabbed == generate_verilog(ast, indent_str="\t")
+    assert len(cache) == 4
+    print("✓ test_module_cache")
+
+
+def test_leaf_lists():
+    """Test: Lists of identifiers/literals print the same as mixed lists"""
+    ast = parse_verilog("""module test;
+    assign y = {a, b, 4'h0, c};
+    assign z = {a, b[1], c};
+    initial $display("%d %d", a, 3);
+endmodule""")
+    generated = generate_verilog(ast)
+    assert "assign y = {a, b, 4'h0, c};" in generated
+    assert "assign z = {a, b[1], c};" in generated
+    assert '$display("%d %d", a, 3);' in generated
+
+    class UpperIdents(VerilogCodeGenerator):
+        def _gen_Identifier(self, node):
+            self._write(node.name.upper())
+
+    assert "assign Y = {A, B, 4'h0, C};" in UpperIdents().generate(ast)
+    print("✓ test_leaf_lists")
+
+
+def test_scalar_port_list():
+    """Test: Scalar-only and mixed port lists print one port per line"""
+    ast = parse_verilog("module w(input clk, input signed a, output reg q); endmodule")
+    assert generate_verilog(ast) == (
+        "module w (\n"
+        "    input clk,\n"
+        "    input signed a,\n"
+        "    output reg q\n"
+        ");\n"
+        "\n"
+        "endmodule\n"
+    )
+
+    ast = parse_verilog("module w(input clk, input [3:0] a, output q); endmodule")
+    assert "    input clk,\n    input [3:0] a,\n    output q\n);" in generate_verilog(ast)
+    print("✓ test_scalar_port_list")
+
+
+def test_absent_children():
+    """Test: None children produce no text"""
+    assert generate_verilog(None) == ""
+    node = UnaryOp(op="~", operand=None)
+    assert generate_verilog(node) == "~"
+    assert generate_verilog(node) == "~"
+    print("✓ test_absent_children")
+
+
+def test_repeated_calls_reuse_state_safely():
+    """Test: Back-to-back calls (incl. after an error) do not leak state"""
+    ast = parse_verilog("""module test;
+    initial begin
+        x = 1;
+    end
+endmodule""")
+    expected = generate_verilog(ast)
+
+    class Unknown(ASTNode):
+        pass
+
+    try:
+        generate_verilog(Block(stmts=[Unknown()]))
+        assert False, "Expected NotImplementedError"
+    except NotImplementedError:
+        pass
+
+    assert generate_verilog(ast) == expected
+    assert "\t\tx = 1;" in generate_verilog(ast, indent_str="\t")
+    assert generate_verilog(ast) == expected
+    print("✓ test_repeated_calls_reuse_state_safely")
+
+
+def test_module_instance():
+    """Test: Instances with parameters, signal, expression and empty ports"""
+    ast = parse_verilog("""module top;
+    sub #(.W(8)) u0 (.clk(clk), .a(a[3]), .q());
+    sub u1 (.clk(clk));
+endmodule""")
+    generated = generate_verilog(ast)
+    assert "sub #(.W(8)) u0 (.clk(clk), .a(a[3]), .q());" in generated
+    assert "sub u1 (.clk(clk));" in generated
+    print("✓ test_module_instance")
+
+
+def test_else_single_statement():
+    """Test: Single-statement else drops begin/end; else-if chains stay flat"""
+    ast = parse_verilog("""module test;
+    always @(*) begin
+        if (a) y = 1;
+        else if (b) y = 2;
+        else y = 3;
+    end
+    always @(*) begin
+    end
+endmodule""")
+    generated = generate_verilog(ast)
+    assert (
+        "        if (a) begin\n"
+        "            y = 1;\n"
+        "        end else if (b) begin\n"
+        "            y = 2;\n"
+        "        end else y = 3;\n"
+        "    end\n"
+    ) in generated
+    assert "    always @(*) begin\n    end\n" in generated
+
+    # Re-parsing the output gives the same structure
+    body = parse_verilog(generated).modules[0].body[0].body
+    assert len(body) == 1
+    assert len(body[0].else_body) == 1
+    assert len(body[0].else_body[0].else_body) == 1
+    print("✓ test_else_single_statement")
+
+
 def run_all():
     """Run all code generation tests"""
     tests = [
@@ -248,6 +439,16 @@ def run_all():
         test_round_trip_simple,
         test_round_trip_counter,
         test_system_task,
+        test_dispatch_per_generator_class,
+        test_long_operator_chains,
+        test_indent_str_change_between_runs,
+        test_module_cache,
+        test_leaf_lists,
+        test_scalar_port_list,
+        test_absent_children,
+        test_repeated_calls_reuse_state_safely,
+        test_module_instance,
+        test_else_single_statement,
     ]
 
     passed = 0
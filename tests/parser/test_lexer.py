@@ -0,0 +1,126 @@
+"""
+Tests for the lexer: token values and source positions.
+"""
+
+import sys
+import os
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.insert(0, project_root)
+
+from fpga_synth.hdl_parser.lexer import lex, LexerError
+from fpga_synth.hdl_parser.tokens import TokenType
+
+
+def _tokens(source):
+    """(type, value, line, col) for every token, EOF included."""
+    return [(tok.type, tok.value, tok.line, tok.col) for tok in lex(source)]
+
+
+def test_positions_after_comments():
+    """Test: Comments, directives and blank lines are skipped with correct positions"""
+    source = ("module m; /* block\n"
+              "   comment */ wire a; // line\n"
+              "`define X 1\n"
+              "\r\n"
+              "\tendmodule")
+    assert _tokens(source) == [
+        (TokenType.MODULE, "module", 1, 1),
+        (TokenType.IDENT, "m", 1, 8),
+        (TokenType.SEMICOLON, ";", 1, 9),
+        (TokenType.WIRE, "wire", 2, 15),
+        (TokenType.IDENT, "a", 2, 20),
+        (TokenType.SEMICOLON, ";", 2, 21),
+        (TokenType.ENDMODULE, "endmodule", 5, 2),
+        (TokenType.EOF, "", 5, 11),
+    ]
+
+    # An unterminated block comment runs to the end of the source
+    assert _tokens("x /* open\n comment") == [
+        (TokenType.IDENT, "x", 1, 1),
+        (TokenType.EOF, "", 2, 9),
+    ]
+    print("✓ test_positions_after_comments")
+
+
+def test_number_formats():
+    """Test: Sized, unsized, based and real literals are single NUMBER tokens"""
+    source = "8'hFF 'b1 3'd7 4'bxz_01 1_000 1.5 2.5e10 1.0e-3 1E+3"
+    tokens = lex(source)
+    assert [tok.type for tok in tokens[:-1]] == [TokenType.NUMBER] * 9
+    assert [tok.value for tok in tokens[:-1]] == source.split()
+    assert [tok.col for tok in tokens[:-1]] == [1, 7, 11, 16, 25, 31, 35, 42, 49]
+    print("✓ test_number_formats")
+
+
+def test_identifiers_and_keywords():
+    """Test: Identifiers may contain $ and digits; keywords get their own types"""
+    assert _tokens("reg $display ident$1 _x") == [
+        (TokenType.REG, "reg", 1, 1),
+        (TokenType.IDENT, "$display", 1, 5),
+        (TokenType.IDENT, "ident$1", 1, 14),
+        (TokenType.IDENT, "_x", 1, 22),
+        (TokenType.EOF, "", 1, 24),
+    ]
+    print("✓ test_identifiers_and_keywords")
+
+
+def test_attributes_and_strings():
+    """Test: (* *) delimit attributes except in @(*); strings may span lines"""
+    types = [tok.type for tok in lex("(* keep *) @(*) a *) \"x\"")]
+    assert types == [
+        TokenType.ATTR_BEGIN, TokenType.IDENT, TokenType.ATTR_END,
+        TokenType.AT, TokenType.LPAREN, TokenType.STAR, TokenType.RPAREN,
+        TokenType.IDENT, TokenType.STAR, TokenType.RPAREN, TokenType.STRING, TokenType.EOF,
+    ]
+
+    assert _tokens('"two\nlines \\"q\\"" x') == [
+        (TokenType.STRING, 'two\nlines "q"', 1, 1),
+        (TokenType.IDENT, "x", 2, 14),
+        (TokenType.EOF, "", 2, 15),
+    ]
+    print("✓ test_attributes_and_strings")
+
+
+def test_unexpected_character():
+    """Test: Characters outside the language are reported with their position"""
+    try:
+        lex("wire a;\n  \\ b;")
+        assert False, "Should have raised LexerError"
+    except LexerError as e:
+        assert (e.line, e.col) == (2, 3)
+    print("✓ test_unexpected_character")
+
+
+def run_all():
+    """Run all lexer tests"""
+    tests = [
+        test_positions_after_comments,
+        test_number_formats,
+        test_identifiers_and_keywords,
+        test_attributes_and_strings,
+        test_unexpected_character,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except Exception as e:
+            print(f"✗ {test.__name__}: {e}")
+            failed += 1
+            import traceback
+            traceback.print_exc()
+
+    print(f"\n{'='*50}")
+    print(f"Lexer Tests: {passed} passed, {failed} failed, {passed+failed} total")
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    print("Running lexer tests...\n")
+    run_all()
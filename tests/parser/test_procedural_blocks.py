@@ -11,6 +11,7 @@ sys.path.insert(0, project_root)
 
 from fpga_synth.hdl_parser.parser import parse_verilog
 from fpga_synth.hdl_parser.ast_nodes import *
+from fpga_synth.hdl_parser.ast_json import ast_to_dict, dict_to_ast
 
 
 def test_initial_block():
@@ -241,6 +242,43 @@ def test_initial_with_always():
     print("✓ test_initial_with_always")
 
 
+def test_missing_else_and_default_share_empty():
+    """Test: if without else / case without default use the shared empty tuple"""
+    verilog = """
+    module test(input [1:0] s, input a, output reg y);
+        always @(*) begin
+            if (a)
+                y = 1'b1;
+            case (s)
+                2'd0: y = 1'b0;
+            endcase
+        end
+    endmodule
+    """
+    ast = parse_verilog(verilog)
+    always = ast.modules[0].body[0]
+    if_stmt, case_stmt = always.body
+
+    assert if_stmt.else_body is EMPTY_STMTS
+    assert case_stmt.default is EMPTY_STMTS
+    assert IfStatement().else_body is EMPTY_STMTS
+    assert len(if_stmt.then_body) == 1
+
+    # Empty lists given explicitly become the shared tuple, so such nodes
+    # compare equal to parsed ones, also after a JSON round trip
+    built = IfStatement(cond=if_stmt.cond, then_body=if_stmt.then_body, else_body=[],
+                        line=if_stmt.line, col=if_stmt.col)
+    assert built.else_body is EMPTY_STMTS and built == if_stmt
+    assert CaseStatement(default=[]).default is EMPTY_STMTS
+
+    data = ast_to_dict(case_stmt)
+    assert "default" not in data
+    data["default"] = []
+    assert dict_to_ast(data) == case_stmt
+    assert dict_to_ast(ast_to_dict(if_stmt)) == if_stmt
+    print("✓ test_missing_else_and_default_share_empty")
+
+
 def run_all():
     """Run all procedural block tests"""
     tests = [
@@ -252,6 +290,7 @@ def run_all():
         test_nested_loops,
         test_multiple_initial_blocks,
         test_initial_with_always,
+        test_missing_else_and_default_share_empty,
     ]
 
     passed = 0
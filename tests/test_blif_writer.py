@@ -0,0 +1,151 @@
+"""
+Tests for the BLIF backend.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from fpga_synth.hdl_parser.parser import parse_verilog
+from fpga_synth.hdl_parser.elaborator import elaborate
+from fpga_synth.ir.types import CellOp, BitWidth
+from fpga_synth.ir.netlist import Netlist, reset_ids
+from fpga_synth.backend import blif_writer
+from fpga_synth.backend.blif_writer import netlist_to_blif
+
+
+def _and_gate() -> Netlist:
+    """a & b → y, built directly on the netlist API."""
+    reset_ids()
+    nl = Netlist("and2")
+    a = nl.add_module_input("a", BitWidth(0))
+    b = nl.add_module_input("b", BitWidth(0))
+    y = nl.add_module_output("y", BitWidth(0))
+    g = nl.create_cell(CellOp.AND, name="g", input_names=["A", "B"])
+    nl.connect(a.output, g.inputs["A"])
+    nl.connect(b.output, g.inputs["B"])
+    nl.connect(g.output, y.inputs["A"], nl.create_net("w"))
+    return nl
+
+
+def test_blif_and_gate():
+    """Test: Exact BLIF text for a single AND gate"""
+    nl = _and_gate()
+    a_net = nl.inputs["a"].output.net.name
+    b_net = nl.inputs["b"].output.net.name
+    blif = netlist_to_blif(nl)
+    assert blif == "\n".join([
+        ".model and2",
+        ".inputs a b",
+        ".outputs y",
+        "",
+        f".names {a_net} {b_net} w",
+        "11 1",
+        "",
+        "# output y",
+        ".names w y",
+        "1 1",
+        "",
+        ".end",
+    ])
+    print("✓ test_blif_and_gate")
+
+
+def test_blif_as_bytes():
+    """Test: as_bytes=True returns the same text, UTF-8 encoded"""
+    text = netlist_to_blif(_and_gate())
+    data = netlist_to_blif(_and_gate(), as_bytes=True)
+    assert isinstance(data, bytes)
+    assert data.decode() == text
+    print("✓ test_blif_as_bytes")
+
+
+def test_blif_unconnected_pin():
+    """Test: Unconnected input pins are written as '?'"""
+    reset_ids()
+    nl = Netlist("dangling")
+    inv = nl.create_cell(CellOp.NOT, name="inv", input_names=["A"])
+    nl.create_net("q").set_driver(inv.output)
+    blif = netlist_to_blif(nl)
+    assert ".names ? q\n0 1\n" in blif
+    print("✓ test_blif_unconnected_pin")
+
+
+def test_blif_sequential_design():
+    """Test: Registers become latches, unsupported ops become subckts"""
+    verilog = """
+    module seq(input clk, input s, input [3:0] a, input [3:0] b,
+               output [3:0] y, output reg [3:0] q);
+        assign y = s ? a + b : a;
+        always @(posedge clk) q <= a;
+    endmodule
+    """
+    reset_ids()
+    blif = netlist_to_blif(elaborate(parse_verilog(verilog)))
+    lines = blif.split("\n")
+
+    assert lines[0] == ".model seq"
+    assert lines[1] == ".inputs clk s a b"
+    assert lines[2] == ".outputs y q"
+    assert lines[-1] == ".end"
+    assert any(l.startswith(".latch ") and l.endswith(" re clk 0") for l in lines)
+    assert any(l.startswith(".subckt ADD A=") for l in lines)
+    assert "# MUX: S ? B : A" in lines
+    print("✓ test_blif_sequential_design")
+
+
+def test_blif_parallel_matches_serial():
+    """Test: Chunked emission in worker processes gives identical output"""
+    verilog = """
+    module par(input clk, input s, input [3:0] a, input [3:0] b,
+               output [3:0] y, output reg [3:0] q);
+        assign y = s ? (a & b) ^ (a | b) : ~a;
+        always @(posedge clk) q <= a + b;
+    endmodule
+    """
+    reset_ids()
+    nl = elaborate(parse_verilog(verilog))
+    serial = netlist_to_blif(nl)
+
+    saved = blif_writer.PARALLEL_MIN_CELLS
+    blif_writer.PARALLEL_MIN_CELLS = 0
+    try:
+        assert netlist_to_blif(nl, workers=3) == serial
+    finally:
+        blif_writer.PARALLEL_MIN_CELLS = saved
+    print("✓ test_blif_parallel_matches_serial")
+
+
+def run_all():
+    """Run all BLIF writer tests"""
+    tests = [
+        test_blif_and_gate,
+        test_blif_as_bytes,
+        test_blif_unconnected_pin,
+        test_blif_sequential_design,
+        test_blif_parallel_matches_serial,
+    ]
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            passed += 1
+        except Exception as e:
+            print(f"✗ {test.__name__}: {e}")
+            failed += 1
+            import traceback
+            traceback.print_exc()
+
+    print(f"\n{'='*50}")
+    print(f"BLIF Writer Tests: {passed} passed, {failed} failed, {passed+failed} total")
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    print("Running BLIF writer tests...\n")
+    run_all()
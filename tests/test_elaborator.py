@@ -8,7 +8,10 @@ project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(_
 sys.path.insert(0, project_root)
 
 from fpga_synth.hdl_parser.parser import parse_verilog
-from fpga_synth.hdl_parser.elaborator import elaborate, ElaborationError
+from fpga_synth.hdl_parser import elaborator as elaborator_module
+from fpga_synth.hdl_parser.elaborator import elaborate, Elaborator, ElaborationError
+from fpga_synth.hdl_parser.ast_nodes import (BinaryOp, Concat, Identifier, NumberLiteral, Repeat,
+                                             TernaryOp, UnaryOp)
 from fpga_synth.ir.types import CellOp
 
 
@@ -180,6 +183,202 @@ def test_not_gate():
     print("✓ test_not_gate")
 
 
+def test_constants_shared():
+    """Test: Repeated literals share one CONST cell; direct assigns stay driven"""
+    verilog = """
+    module test(input wire [3:0] a, output wire [3:0] x, output wire [3:0] y,
+                output wire [3:0] z, output wire [3:0] w);
+        assign x = a & 4'd1;
+        assign y = a | 4'd1;
+        assign z = 4'd1;
+        assign w = a + 4'd1 + 4'd2;
+    endmodule
+    """
+    netlist = elaborate(parse_verilog(verilog))
+    consts = [cell for cell in netlist.cells.values() if cell.op == CellOp.CONST]
+    assert [cell.attributes["value"] for cell in consts] == [1, 1, 2]
+
+    # z took over the shared constant, and its earlier users moved along
+    # with it; later uses of the literal get a fresh CONST cell
+    z_net = netlist.outputs["z"].inputs["A"].net
+    assert consts[0].output.net is z_net
+    for op in (CellOp.AND, CellOp.OR):
+        cell = next(cell for cell in netlist.cells.values() if cell.op == op)
+        assert cell.inputs["B"].net is z_net
+    assert all(pin.net is z_net for pin in z_net.sinks)
+    add_cell = next(cell for cell in netlist.cells.values() if cell.op == CellOp.ADD)
+    assert add_cell.inputs["B"].net is consts[1].output.net
+
+    print("✓ test_constants_shared")
+
+
+def test_constant_folding():
+    """Test: Operators on literals fold to the value their cell would compute"""
+    def output_value(expr, width):
+        verilog = f"""
+        module test(output wire [{width - 1}:0] y);
+            assign y = {expr};
+        endmodule
+        """
+        netlist = elaborate(parse_verilog(verilog))
+        assert [cell.op for cell in netlist.cells.values()] == [CellOp.MODULE_OUTPUT, CellOp.CONST]
+        driver = netlist.outputs["y"].inputs["A"].net.driver.cell
+        return driver.attributes["value"]
+
+    cases = [
+        ("8'd250 + 8'd10", 8, 4), ("4'd3 - 4'd5", 4, 14), ("4'd6 * 4'd3", 4, 2),
+        ("8'hF0 & 8'h3C", 8, 0x30), ("8'hF0 | 8'h0F", 8, 0xFF), ("8'hFF ^ 8'h0F", 8, 0xF0),
+        ("8'd7 == 8'd7", 1, 1), ("8'd7 != 8'd7", 1, 0), ("8'd3 < 8'd4", 1, 1),
+        ("8'd5 > 8'd4", 1, 1), ("8'd5 >= 8'd6", 1, 0),
+        ("4'b0011 << 4'd3", 4, 8), ("8'hF0 >> 8'd4", 8, 0x0F), ("~4'd5", 4, 10), ("-4'd1", 4, 15),
+        ("&4'hF", 1, 1), ("|4'h0", 1, 0), ("^4'b0111", 1, 1),
+        ("1'b1 ? 4'd9 : 4'd2", 4, 9), ("1'b0 ? 4'd9 : 4'd2", 4, 2),
+    ]
+    for expr, width, expected in cases:
+        assert output_value(expr, width) == expected, expr
+
+    # Shifts are only cut off at the result width, however wide it is
+    assert output_value("8192'd1 << 13'd5000", 8192) == 1 << 5000
+    assert output_value("8192'd1 << 14'd8192", 8192) == 0
+
+    # Folding can be turned off
+    netlist = elaborate(parse_verilog("""
+    module test(output wire [7:0] y);
+        assign y = 8'd1 + 8'd2;
+    endmodule
+    """), fold_constants=False)
+    assert any(cell.op == CellOp.ADD for cell in netlist.cells.values())
+
+    # A chain folds only while it is constant: (1 + 2) + a keeps one ADD
+    verilog = """
+    module test(input wire [7:0] a, output wire [7:0] y, output wire [7:0] z);
+        assign y = 8'd1 + 8'd2 + a;
+        assign z = a + 8'd1 + 8'd2;
+    endmodule
+    """
+    netlist = elaborate(parse_verilog(verilog))
+    consts = [cell for cell in netlist.cells.values() if cell.op == CellOp.CONST]
+    adds = [cell for cell in netlist.cells.values() if cell.op == CellOp.ADD]
+    assert sorted(cell.attributes["value"] for cell in consts) == [1, 2, 3]
+    assert len(adds) == 3
+
+    print("✓ test_constant_folding")
+
+
+def test_constant_subtrees_folded():
+    """Test: Nested constant subtrees and parameter references fold to one CONST"""
+    verilog = """
+    module test #(parameter W = 3) (input wire [7:0] a,
+                                    output wire [7:0] y, output wire [7:0] z);
+        assign y = a + (W * 2);
+        assign z = ~(8'd1 + 8'd2) ^ (W == 3 ? 8'd4 : 8'd5);
+    endmodule
+    """
+    netlist = elaborate(parse_verilog(verilog))
+    ops = sorted(cell.op.name for cell in netlist.cells.values())
+    assert ops == ["ADD", "CONST", "CONST", "MODULE_INPUT", "MODULE_OUTPUT", "MODULE_OUTPUT"]
+    z_driver = netlist.outputs["z"].inputs["A"].net.driver.cell
+    assert z_driver.op == CellOp.CONST
+    assert z_driver.attributes["value"] == (~3 ^ 4) & 0xFF
+    add = next(cell for cell in netlist.cells.values() if cell.op == CellOp.ADD)
+    assert add.inputs["B"].net.driver.cell.attributes["value"] == 6
+
+    # Without folding, parameter references still elaborate to constants
+    netlist = elaborate(parse_verilog(verilog), fold_constants=False)
+    assert any(cell.op == CellOp.MUL for cell in netlist.cells.values())
+    assert any(cell.op == CellOp.CONST and cell.attributes["value"] == 3
+               for cell in netlist.cells.values())
+
+    print("✓ test_constant_subtrees_folded")
+
+
+def test_redundant_mux_skipped():
+    """Test: Ternaries with identical branches or constant conditions build no MUX"""
+    verilog = """
+    module test #(parameter W = 3) (input wire s, input wire t, input wire [3:0] a,
+                                    input wire [3:0] b, output wire [3:0] y,
+                                    output wire [3:0] z);
+        assign y = s ? (a & b) : t ? (a & b) : (a & b);
+        assign z = W == 3 ? a + b : a - b;
+    endmodule
+    """
+    netlist = elaborate(parse_verilog(verilog))
+    ops = [cell.op for cell in netlist.cells.values()]
+    assert CellOp.MUX not in ops and CellOp.SUB not in ops
+    assert ops.count(CellOp.AND) == 1 and ops.count(CellOp.ADD) == 1
+    assert netlist.outputs["z"].inputs["A"].net.driver.cell.op == CellOp.ADD
+
+    # Constant conditions are only resolved when folding
+    netlist = elaborate(parse_verilog(verilog), fold_constants=False)
+    assert sum(cell.op == CellOp.MUX for cell in netlist.cells.values()) == 1
+
+    print("✓ test_redundant_mux_skipped")
+
+
+def test_skipped_mux_keeps_signal_driver():
+    """Test: A ternary that selects a port is buffered, not merged into the LHS"""
+    verilog = """
+    module test #(parameter P = 1) (input wire [3:0] a, input wire [3:0] b, input wire s,
+                                    output wire [3:0] x, output wire [3:0] y,
+                                    output wire [3:0] z);
+        assign x = s ? a : a;
+        assign y = P ? a : b;
+        assign z = a & b;
+    endmodule
+    """
+    netlist = elaborate(parse_verilog(verilog))
+    a_net = netlist.inputs["a"].output.net
+    assert a_net.name == "a"
+    and_cell = next(cell for cell in netlist.cells.values() if cell.op == CellOp.AND)
+    assert and_cell.inputs["A"].net is a_net
+
+    for name in ("x", "y"):
+        driver = netlist.outputs[name].inputs["A"].net.driver.cell
+        assert driver.op == CellOp.BUF
+        assert driver.inputs["A"].net is a_net
+
+    print("✓ test_skipped_mux_keeps_signal_driver")
+
+
+def test_common_subexpressions_shared():
+    """Test: Identical subexpressions are built once and drive every use"""
+    verilog = """
+    module test(input wire a, input wire b, input wire c,
+                output wire y, output wire z, output wire w);
+        assign y = (a & b) | c;
+        assign z = (a & b) ^ c;
+        assign w = a & b;
+    endmodule
+    """
+    netlist = elaborate(parse_verilog(verilog))
+    ands = [cell for cell in netlist.cells.values() if cell.op == CellOp.AND]
+    assert len(ands) == 1
+    and_out = ands[0].outputs["Y"]
+
+    # The assign to w takes over the shared net's driver and its sinks
+    w_net = netlist.outputs["w"].inputs["A"].net
+    assert w_net.driver is and_out
+    for op in (CellOp.OR, CellOp.XOR):
+        user = next(cell for cell in netlist.cells.values() if cell.op == op)
+        assert user.inputs["A"].net is w_net
+
+    netlist = elaborate(parse_verilog(verilog), share_subexpressions=False)
+    assert sum(cell.op == CellOp.AND for cell in netlist.cells.values()) == 3
+
+    # Commutative operators match with their operands swapped
+    verilog = """
+    module test(input wire [3:0] a, input wire [3:0] b, output wire [3:0] y, output wire [3:0] z);
+        assign y = (a + b) | (a - b);
+        assign z = (b + a) ^ (b - a);
+    endmodule
+    """
+    netlist = elaborate(parse_verilog(verilog))
+    ops = [cell.op for cell in netlist.cells.values()]
+    assert ops.count(CellOp.ADD) == 1
+    assert ops.count(CellOp.SUB) == 2
+    print("✓ test_common_subexpressions_shared")
+
+
 def test_mux():
     """Test: Elaborate ternary (MUX) operation"""
     verilog = """
@@ -246,6 +445,108 @@ def test_parameter_resolution():
     print("✓ test_parameter_resolution")
 
 
+def test_body_item_order():
+    """Test: Parameters and declarations apply to the whole body, in any order"""
+    verilog = """
+    module test(input wire [7:0] a, output wire [7:0] y);
+        assign y = t;
+        assign t = a;
+        wire [W-1:0] t;
+        localparam W = 8;
+    endmodule
+    """
+    netlist = elaborate(parse_verilog(verilog))
+    t_nets = [net for net in netlist.nets.values() if net.name == "t"]
+    assert len(t_nets) == 1
+    assert t_nets[0].width.width == 8
+    print("✓ test_body_item_order")
+
+
+def test_declared_nets_created_on_use():
+    """Test: Declared signals get a net, with the declared width, only once used"""
+    verilog = """
+    module test(input wire clk, input wire [3:0] a, output wire [3:0] y);
+        wire [3:0] unused;
+        reg [3:0] r;
+        assign y = r;
+        always @(posedge clk) r <= a;
+    endmodule
+    """
+    netlist = elaborate(parse_verilog(verilog))
+    names = {net.name: net for net in netlist.nets.values()}
+    assert "unused" not in names
+    assert names["r"].width.width == 4
+    print("✓ test_declared_nets_created_on_use")
+
+
+def test_constant_expression_operators():
+    """Test: Parameter expressions use Verilog integer arithmetic"""
+    verilog = """
+    module test #(
+        parameter A = 7,
+        parameter B = (A * 3 - 1) / 4 % 3,
+        parameter C = (A & 6) | (1 << 3) ^ (16 >> 2)
+    )(
+        input wire [B:0] x,
+        input wire [C:0] y
+    );
+    endmodule
+    """
+    netlist = elaborate(parse_verilog(verilog))
+    assert netlist.inputs["x"].output.width.width == 3    # B = 20 / 4 % 3 = 2
+    assert netlist.inputs["y"].output.width.width == 15   # C = 6 | (8 ^ 4) = 14
+    print("✓ test_constant_expression_operators")
+
+
+def test_constant_expression_memoized():
+    """Test: A constant expression node is evaluated once per module"""
+    class CountingElaborator(Elaborator):
+        def __init__(self):
+            super().__init__()
+            self.lookups = 0
+
+        def _eval_const_identifier(self, expr):
+            self.lookups += 1
+            return super()._eval_const_identifier(expr)
+
+    # Both instances evaluate the same default expression node in the parent
+    verilog = """
+    module child #(parameter A = 1, parameter W = A + 1)(input wire a, output wire y);
+        assign y = a;
+    endmodule
+    module top(input wire a, output wire y0, output wire y1);
+        parameter A = 4;
+        child c0 (.a(a), .y(y0));
+        child c1 (.a(a), .y(y1));
+    endmodule
+    """
+    elab = CountingElaborator()
+    elab.elaborate(parse_verilog(verilog), top_module="top")
+    assert elab.lookups == 1
+    print("✓ test_constant_expression_memoized")
+
+
+def test_constant_expression_compiled_once():
+    """Test: Constant expressions are compiled once and shared by all instances"""
+    verilog = """
+    module child #(parameter W = 2)(input wire a, output wire y);
+        wire [W * 2 - 1:0] t;
+        assign t = a;
+        assign y = a;
+    endmodule
+    module top(input wire a, output wire y0, output wire y1);
+        child c0 (.a(a), .y(y0));
+        child c1 (.a(a), .y(y1));
+    endmodule
+    """
+    elab = Elaborator()
+    netlist = elab.elaborate(parse_verilog(verilog), top_module="top")
+    widths = {net.name: net.width.width for net in netlist.nets.values()}
+    assert widths["c0.t"] == widths["c1.t"] == 4
+    assert len(elab._const_fn_cache) == 1  # W * 2 - 1
+    print("✓ test_constant_expression_compiled_once")
+
+
 def test_arithmetic():
     """Test: Elaborate arithmetic operations"""
     verilog = """
@@ -294,6 +595,167 @@ def test_comparison():
     print("✓ test_comparison")
 
 
+def test_expression_dispatch():
+    """Test: Handlers are looked up per node class; overrides and unknown types"""
+    class WideIdentifier(Identifier):
+        __slots__ = ()
+
+    class CountingElaborator(Elaborator):
+        def __init__(self):
+            super().__init__()
+            self.binary_ops = 0
+
+        def _elaborate_binary_op(self, expr):
+            self.binary_ops += 1
+            return super()._elaborate_binary_op(expr)
+
+    verilog = """
+    module test(input wire [3:0] a, input wire [3:0] b, output wire [3:0] y);
+        assign y = a | (b & a);
+    endmodule
+    """
+    elab = CountingElaborator()
+    elab.elaborate(parse_verilog(verilog))
+    assert elab.binary_ops == 2
+
+    # The base class table is not affected by the subclass override
+    plain = Elaborator()
+    plain.elaborate(parse_verilog(verilog))
+    assert Elaborator._expr_dispatch[BinaryOp] is Elaborator._elaborate_binary_op
+
+    # Node subclasses resolve through their base class
+    assert plain._elaborate_expr(WideIdentifier(name="a")) is plain.net_map["a"]
+    plain.parameters["N"] = 4
+    assert plain._eval_const_expr(WideIdentifier(name="N")) == 4
+
+    try:
+        plain._elaborate_expr(Repeat())
+        assert False, "Repeat is not elaborated"
+    except ElaborationError as e:
+        assert "Unsupported expression type: Repeat" in str(e)
+
+    try:
+        plain._eval_const_expr(Repeat())
+        assert False, "Repeat is not a constant"
+    except ElaborationError as e:
+        assert "Cannot evaluate non-constant expression: Repeat" in str(e)
+
+    print("✓ test_expression_dispatch")
+
+
+def test_long_operator_chains():
+    """Test: Long operator chains elaborate without hitting the recursion limit"""
+    n = 3000
+    verilog = f"""
+    module test(input wire [3:0] a, input wire [3:0] b, output wire [3:0] y);
+        assign y = {" + ".join(["a", "b"] * n)};
+    endmodule
+    """
+    netlist = elaborate(parse_verilog(verilog))
+    add_cells = [cell for cell in netlist.cells.values() if cell.op == CellOp.ADD]
+    assert len(add_cells) == 2 * n - 1
+
+    # Cells are created innermost operator first: a + b, then (a + b) + a, ...
+    first = add_cells[0]
+    assert first.inputs["A"].net.name == "a"
+    assert first.inputs["B"].net.name == "b"
+    assert add_cells[1].inputs["A"].net is first.output.net
+    assert netlist.outputs["y"].inputs["A"].net.driver is add_cells[-1].output
+
+    # Else-if chains nest down the false value: s ? a : s ? b : ... : a
+    elab = Elaborator()
+    elab.elaborate(parse_verilog("""
+    module test(input wire s, input wire [3:0] a, input wire [3:0] b);
+    endmodule
+    """))
+    expr = Identifier(name="a")
+    for _ in range(n):
+        expr = TernaryOp(cond=Identifier(name="s"), true_val=Identifier(name="b"), false_val=expr)
+    out_net = elab._elaborate_expr(expr)
+    mux_cells = [cell for cell in elab.netlist.cells.values() if cell.op == CellOp.MUX]
+    assert len(mux_cells) == n
+    assert mux_cells[0].inputs["A"].net.name == "a"
+    assert out_net.driver is mux_cells[-1].output
+
+    # Constant expressions too
+    elab.parameters["N"] = 1
+    chain = Identifier(name="N")
+    for _ in range(n):
+        chain = BinaryOp(op="+", left=chain, right=Identifier(name="N"))
+    assert elab._eval_const_expr(chain) == n + 1
+
+    print("✓ test_long_operator_chains")
+
+
+def test_deeply_nested_expressions():
+    """Test: Nesting that loops cannot flatten elaborates without deep recursion"""
+    n = 3000
+    for share in (True, False):
+        elab = Elaborator(share_subexpressions=share)
+        elab.elaborate(parse_verilog("""
+        module test(input wire [3:0] a, input wire [3:0] b);
+        endmodule
+        """))
+
+        # b + (b + (... + a)), ~~...~a and {b, {b, ... a}}
+        right = unary = concat = Identifier(name="a")
+        for _ in range(n):
+            right = BinaryOp(op="+", left=Identifier(name="b"), right=right)
+            unary = UnaryOp(op="~", operand=unary)
+            concat = Concat(parts=[Identifier(name="b"), concat])
+        for expr, op in ((right, CellOp.ADD), (unary, CellOp.NOT), (concat, CellOp.CONCAT)):
+            out_net = elab._elaborate_expr(expr)
+            cells = [cell for cell in elab.netlist.cells.values() if cell.op == op]
+            assert len(cells) == n
+            assert out_net.driver.cell.op == op
+
+        # Constant trees still fold to one literal
+        lit = NumberLiteral(raw="8'd5", value=5, width=8)
+        for _ in range(n + 1):
+            lit = UnaryOp(op="~", operand=lit)
+        out_net = elab._elaborate_expr(lit)
+        assert out_net.driver.cell.op == CellOp.CONST
+        assert out_net.driver.cell.attributes["value"] == 250
+
+    # The deep path builds the same cells as recursion, skipping folded
+    # operands and unselected branches: 1 ? t : b - a, ~(-4'd3) + t, ~t
+    expr = Identifier(name="a")
+    for i in range(300):
+        if i % 3 == 0:
+            dead = BinaryOp(op="-", left=Identifier(name="b"), right=Identifier(name="a"))
+            expr = TernaryOp(cond=NumberLiteral(raw="1'b1", value=1, width=1),
+                             true_val=expr, false_val=dead)
+        elif i % 3 == 1:
+            const = UnaryOp(op="~", operand=UnaryOp(op="-", operand=NumberLiteral(
+                raw="4'd3", value=3, width=4)))
+            expr = BinaryOp(op="+", left=const, right=expr)
+        else:
+            expr = UnaryOp(op="~", operand=expr)
+
+    def cell_ops(deep):
+        saved = elaborator_module._DEEP_EXPR_DEPTH, sys.getrecursionlimit()
+        if not deep:
+            elaborator_module._DEEP_EXPR_DEPTH = 10 ** 9
+            sys.setrecursionlimit(20000)
+        try:
+            elab = Elaborator()
+            elab.elaborate(parse_verilog("""
+            module test(input wire [3:0] a, input wire [3:0] b);
+            endmodule
+            """))
+            elab._elaborate_expr(expr)
+        finally:
+            elaborator_module._DEEP_EXPR_DEPTH = saved[0]
+            sys.setrecursionlimit(saved[1])
+        return sorted(cell.op.name for cell in elab.netlist.cells.values())
+
+    ops = cell_ops(deep=True)
+    assert ops == cell_ops(deep=False)
+    assert "SUB" not in ops and ops.count("CONST") == 1
+
+    print("✓ test_deeply_nested_expressions")
+
+
 def run_all():
     """Run all elaborator tests"""
     tests = [
@@ -305,11 +767,25 @@ def run_all():
         test_multiple_operations,
         test_const_value,
         test_not_gate,
+        test_constants_shared,
+        test_constant_folding,
+        test_constant_subtrees_folded,
+        test_redundant_mux_skipped,
+        test_skipped_mux_keeps_signal_driver,
+        test_common_subexpressions_shared,
         test_mux,
         test_concat,
         test_parameter_resolution,
+        test_body_item_order,
+        test_declared_nets_created_on_use,
+        test_constant_expression_operators,
+        test_constant_expression_memoized,
+        test_constant_expression_compiled_once,
         test_arithmetic,
         test_comparison,
+        test_expression_dispatch,
+        test_long_operator_chains,
+        test_deeply_nested_expressions,
     ]
 
     passed = 0
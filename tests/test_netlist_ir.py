@@ -318,6 +318,42 @@ def test_dead_logic_removal():
     assert removed == 1  # dead_inv removed
     assert "dead_inv" not in [c.name for c in nl.cells.values()]
 
+def test_net_names_interned():
+    reset_ids()
+    nl = Netlist("intern_test")
+    prefix = "data"
+    net = nl.add_net(Net(name=prefix + "_bus"))
+    assert net.name is sys.intern("data_bus")
+    auto = nl.create_net("".join(["n", "42"]))
+    assert auto.name is sys.intern("n42")
+
+def test_netlist_objects_slotted():
+    cell = Cell(name="g", op=CellOp.AND)
+    pin = cell.add_input("A")
+    for obj in (cell, pin, Net(name="n")):
+        assert not hasattr(obj, "__dict__")
+    try:
+        cell.extra = 1
+        assert False, "Cell accepted an unknown attribute"
+    except AttributeError:
+        pass
+
+def test_netlist_iterators_and_port_removal():
+    reset_ids()
+    nl = Netlist("iter")
+    a = nl.add_module_input("a", BitWidth(0))
+    inv = nl.create_cell(CellOp.NOT, "inv", input_names=["A"], width=BitWidth(0))
+    y = nl.add_module_output("y", BitWidth(0))
+    nl.connect(a.output, inv.inputs["A"])
+    nl.connect(inv.output, y.inputs["A"])
+    assert list(nl.cells_iter()) == [a, inv, y]
+    assert list(nl.nets_iter()) == list(nl.nets.values())
+
+    nl.remove_cell(inv)
+    assert list(nl.inputs) == ["a"] and list(nl.outputs) == ["y"]
+    nl.remove_cell(a)
+    assert nl.inputs == {} and list(nl.outputs) == ["y"]
+
 def test_fanin_cone():
     reset_ids()
     nl = Netlist("cone_test")
@@ -23,7 +23,7 @@ def test_constant_propagation():
     endmodule
     """
     ast = parse_verilog(verilog)
-    netlist = elaborate(ast)
+    netlist = elaborate(ast, fold_constants=False)
 
     # Before optimization: should have CONST cells and ADD cell
     add_cells_before = [c for c in netlist.cells.values() if c.op == CellOp.ADD]
@@ -52,7 +52,7 @@ def test_constant_propagation_logic():
     endmodule
     """
     ast = parse_verilog(verilog)
-    netlist = elaborate(ast)
+    netlist = elaborate(ast, fold_constants=False)
 
     # Before: should have AND cell
     and_cells_before = [c for c in netlist.cells.values() if c.op == CellOp.AND]